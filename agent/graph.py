@@ -1,8 +1,12 @@
 from langgraph.graph import StateGraph, END
 from .state import DraftState
-from .nodes import transcribe_node, intent_node, apply_node, decide_node
+from .nodes import transcribe_node, intent_node, apply_node, decide_node, prefill_llm_async
+
+def build_graph(warmup: bool = True):
+    # Load the model in the background so the first turn skips the cold start
+    if warmup:
+        prefill_llm_async()
 
-def build_graph():
     g = StateGraph(DraftState)
 
     g.add_node("transcribe", transcribe_node)
@@ -1,35 +1,362 @@
 import re
 import os
-from typing import Dict, Any
+import copy
+import functools
+import hashlib
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional
+from pydantic import BaseModel
+from pydantic_core import to_json
 from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage, SystemMessage
-from .schema import Plan
+from .schema import Plan, PLAN_ADAPTER, PLAN_JSON_SCHEMA
 from utils.mic_mem import record_until_enter_mem
 from utils.stt_whisper_mem import transcribe_array
 
-EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", re.ASCII)
+_email_match = EMAIL_RE.fullmatch
+
+# Ollama's default qwen3 tags ship Q4_K_M weights; pick e.g. qwen3:8b-q8_0 via OLLAMA_MODEL for higher precision
+DEFAULT_LLM_MODEL = "qwen3:8b"
 
 # Global, mutable model setting configured by the UI (defaults to qwen3:8b)
-GLOBAL_LLM_MODEL = os.getenv("OLLAMA_MODEL", "qwen3:8b")
+GLOBAL_LLM_MODEL = os.getenv("OLLAMA_MODEL", DEFAULT_LLM_MODEL)
+
+LLM_TEMPERATURE = 0.15
+LLM_NUM_CTX = 8192
+# Keep the model (and its prompt cache) resident between editing turns
+LLM_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
 
 def set_llm_model(model: str):
     """Set preferred Ollama model; used by the UI settings dialog."""
     global GLOBAL_LLM_MODEL
-    GLOBAL_LLM_MODEL = (model or "qwen3:8b").strip()
+    new_model = (model or DEFAULT_LLM_MODEL).strip()
+    if new_model != GLOBAL_LLM_MODEL:
+        _cached_llm.cache_clear()
+        _cached_structured_llm.cache_clear()
+    GLOBAL_LLM_MODEL = new_model
 
 # Helpers
+@functools.lru_cache(maxsize=4)
+def _cached_llm(model: str, temperature: float, num_ctx: int, num_predict: Optional[int] = None) -> ChatOllama:
+    return ChatOllama(
+        model=model,
+        temperature=temperature,
+        num_ctx=num_ctx,
+        num_predict=num_predict,
+        keep_alive=LLM_KEEP_ALIVE,
+    )
+
+@functools.lru_cache(maxsize=4)
+def _cached_structured_llm(model: str, temperature: float, num_ctx: int) -> Any:
+    # Schema binding is the expensive part; reuse it across graph iterations.
+    # Binding the precomputed JSON schema yields plain dicts, validated via PLAN_ADAPTER.
+    return _cached_llm(model, temperature, num_ctx).with_structured_output(
+        schema=PLAN_JSON_SCHEMA, method="json_schema"
+    )
+
 def make_llm():
-    model = GLOBAL_LLM_MODEL or "qwen3:8b"
-    return ChatOllama(model=model, temperature=0.15, num_ctx=8192)
+    model = GLOBAL_LLM_MODEL or DEFAULT_LLM_MODEL
+    return _cached_llm(model, LLM_TEMPERATURE, LLM_NUM_CTX)
 
 def make_structured_llm() -> Any:
-    return make_llm().with_structured_output(Plan)
+    model = GLOBAL_LLM_MODEL or DEFAULT_LLM_MODEL
+    return _cached_structured_llm(model, LLM_TEMPERATURE, LLM_NUM_CTX)
+
+def _clean_emails(*lists) -> list:
+    """Normalize, validate and order-preserving dedupe one or more address lists.
+    Lists are chained, not concatenated, so merging never builds a temporary list.
+    """
+    sources = [lst for lst in lists if lst and isinstance(lst, list)]
+    if not sources:
+        return []
+    return list(dict.fromkeys(
+        s for e in itertools.chain.from_iterable(sources) if isinstance(e, str)
+        for s in (e.strip().lower(),) if _email_match(s)
+    ))
+
+# Template-shaped commands ("subject: ... | to: ... | cc: ... | tone: ...") parsed without the LLM
+# (pattern, key): compact "field: value" commands plus a few common spoken phrasings
+_FAST_CMDS = [
+    (re.compile(r"^\s*(?P<key>subject|to|cc|tone)\s*:\s*(?P<val>.+?)\s*$", re.IGNORECASE), None),
+    (re.compile(r"^\s*(?:set|change)\s+(?:the\s+)?subject\s+to\s+(?P<val>.+?)\.?\s*$", re.IGNORECASE), "subject"),
+    (re.compile(r"^\s*(?:send|address)\s+(?:it\s+|this\s+)?to\s+(?P<val>.+?)\s*$", re.IGNORECASE), "to"),
+    # Spoken "cc x" adds to the Cc list (as the LLM path does); only "cc: x" replaces it
+    (re.compile(r"^\s*(?:cc|copy\s+in)\s+(?P<val>.+?)\s*$", re.IGNORECASE), "cc_add"),
+    (re.compile(r"^\s*(?:make\s+it|be|sound)\s+(?:more\s+)?(?P<val>\w+)\W*$", re.IGNORECASE), "tone"),
+]
+_CMD_SPLIT_RE = re.compile(r"\n|\s\|\s")
+# What may surround the addresses in a recipients-only phrase ("a@x.com and b@y.org.")
+_RECIPIENT_GLUE_RE = re.compile(r"(?:[\s,;.]|\band\b)*", re.IGNORECASE)
+_TONES = {"friendly", "formal", "neutral"}
+# A second instruction inside a subject value ("... and cc bob@x.com", "..., make it formal"):
+# the value runs to the end of the line, so such input goes to the LLM instead
+_SUBJECT_CLAUSE_RE = re.compile(
+    r"@|(?:,|;|\band\b|\bthen\b|\balso\b)\s*(?:please\s+)?"
+    r"(?:cc|copy\s+in|send|address|add|remove|set|change|make|be|sound|tone|subject|to)\b",
+    re.IGNORECASE,
+)
+
+def _match_cmd(part: str):
+    for rx, key in _FAST_CMDS:
+        m = rx.match(part)
+        if m:
+            return (key or m.group("key")).lower(), m.group("val")
+    return None
+
+def _fast_plan(transcript: str, body: str = "") -> Optional[Dict[str, Any]]:
+    """Build a Plan dict when every part of the input is a recognized command, else None.
+    A tone change on a non-empty `body` goes to the LLM, which also rewrites greeting/farewell.
+    """
+    updates: Dict[str, Any] = {}
+    for part in _CMD_SPLIT_RE.split(transcript):
+        if not part.strip():
+            continue
+        cmd = _match_cmd(part)
+        if cmd is None:
+            return None  # free text -> body implied, needs the LLM
+        key, val = cmd
+        if key == "subject":
+            if _SUBJECT_CLAUSE_RE.search(val):
+                return None
+            updates["subject"] = val
+        elif key == "tone":
+            tone = val.strip(" .!").lower()
+            if tone not in _TONES or (body and not body.isspace()):
+                return None
+            updates["tone"] = tone
+        else:
+            # Only plain addresses; names ("send it to Anna") need the LLM
+            if not _RECIPIENT_GLUE_RE.fullmatch(EMAIL_RE.sub(" ", val)):
+                return None
+            emails = _clean_emails(EMAIL_RE.findall(val))
+            if not emails:
+                return None
+            updates[key if key.endswith("_add") else f"{key}_set"] = emails
+    return {"updates": updates} if updates else None
+
+# Fillers / aborted utterances that carry no edit ("uh", "ähm", "never mind", ...).
+# Only true fillers and explicit cancels: "No" or "Thanks" are valid one-word dictations.
+# Matched per word (no nested repetition), so a non-matching transcript stays linear.
+_FILLER_WORD_RE = re.compile(r"u+h+m*|u+m+|h+m+|ä+h+m*|cancel|nevermind|abbrechen", re.IGNORECASE)
+_NEVER_MIND_RE = re.compile(r"\bnever\s+mind\b", re.IGNORECASE)
+_WORD_RE = re.compile(r"\w+")
+
+def _is_noop(transcript: str) -> bool:
+    words = _WORD_RE.findall(_NEVER_MIND_RE.sub("nevermind", transcript))
+    return all(_FILLER_WORD_RE.fullmatch(w) for w in words)
+
+class _PlanCache:
+    """Tiny bounded LRU of plan dicts; stores and returns deep copies."""
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        plan = self._data.get(key)
+        if plan is None:
+            return None
+        self._data.move_to_end(key)
+        return copy.deepcopy(plan)
+
+    def put(self, key: Any, plan: Dict[str, Any]) -> None:
+        self._data[key] = copy.deepcopy(plan)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+# Exact responses keyed by (model, instruction, current draft): identical re-recordings skip the LLM
+_INTENT_CACHE = _PlanCache(maxsize=256)
+# Plan templates for recurring, draft-independent instructions ("set tone to formal",
+# "add cc bob@x.com"); keyed by (model, normalized instruction text)
+_PLAN_TEMPLATES = _PlanCache(maxsize=128)
+
+class _DiskPlanCache:
+    """Opt-in persistent plan cache: one JSON file per SHA-256 key under `root`."""
+    def __init__(self, root: Optional[str]):
+        self._root = os.path.expanduser(root) if root else None
+
+    def _path(self, key: Any) -> Optional[str]:
+        if not self._root:
+            return None
+        digest = hashlib.sha256(to_json(key)).hexdigest()
+        return os.path.join(self._root, f"{digest}.json")
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                plan = PLAN_ADAPTER.validate_json(f.read())
+        except Exception:
+            return None  # missing, unreadable or from an older schema
+        return PLAN_ADAPTER.dump_python(plan, exclude_none=True)
+
+    def put(self, key: Any, plan: Plan) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            os.makedirs(self._root, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                # Full dump, nulls included: every Plan field is required, so an
+                # exclude_none dict would never validate again in get()
+                f.write(PLAN_ADAPTER.dump_json(plan))
+            os.replace(tmp, path)  # atomic: readers never see a partial file
+        except OSError:
+            pass
+
+# Cached plans contain draft text, so persisting them is opt-in:
+# MAILWHISPER_PLAN_CACHE_DIR=~/.cache/mailwhisper/plans
+_DISK_PLAN_CACHE = _DiskPlanCache(os.getenv("MAILWHISPER_PLAN_CACHE_DIR"))
+_NORM_RE = re.compile(r"[^\w@.+-]+")
+
+def _normalize_instruction(text: str) -> str:
+    return " ".join(_NORM_RE.sub(" ", text.lower()).split()).strip(".")
+
+# Only these ops mean the same thing on any draft; *_set would replace another draft's
+# recipients, and body/subject are draft text
+_TEMPLATE_OPS = ("to_add", "cc_add", "tone")
+
+def _draft_independent_template(plan: Dict[str, Any], state: Dict) -> Optional[Dict[str, Any]]:
+    """Keep only *_add/tone updates; None if the plan also changes body, subject or a *_set list."""
+    updates = plan.get("updates") or {}
+    body_text = (updates.get("body") or {}).get("text")
+    if body_text and body_text.strip() != (state.get("body") or "").strip():
+        return None
+    subject = updates.get("subject")
+    if subject is not None and subject != (state.get("subject") or ""):
+        return None
+    # Echoes of this draft's recipients are dropped; any other *_set makes the plan draft-specific
+    for op, field in (("to_set", "to"), ("cc_set", "cc")):
+        value = updates.get(op)
+        if value is not None and _clean_emails(value) != _clean_emails(state.get(field)):
+            return None
+    kept = {op: updates[op] for op in _TEMPLATE_OPS if updates.get(op) is not None}
+    return {**plan, "updates": kept}
+
+def _store_plan_template(key: tuple, plan: Dict[str, Any], state: Dict) -> None:
+    template = _draft_independent_template(plan, state) if key[1] else None
+    if template and template["updates"]:
+        _PLAN_TEMPLATES.put(key, template)
+
+def _template_applies(template: Dict[str, Any], state: Dict) -> bool:
+    """A tone change on a non-empty body also rewrites greeting/farewell: that needs the LLM."""
+    if (template.get("updates") or {}).get("tone") is None:
+        return True
+    body = state.get("body") or ""
+    return not body or body.isspace()
+
+def _as_dict(chunk: Any) -> Dict[str, Any]:
+    """Normalize a (partial) structured-output chunk to a plain dict."""
+    if isinstance(chunk, BaseModel):
+        return chunk.model_dump()
+    return dict(chunk) if isinstance(chunk, dict) else {}
+
+# System Prompt (static; kept byte-identical across turns so Ollama can reuse its prompt cache)
+SYSTEM_MSG = SystemMessage(content=(
+    "You output a STRICT Plan (Pydantic schema). Obey all rules:\n"
+    "GENERAL\n"
+    "• Return ONLY valid Plan JSON. Use null for fields you are not changing.\n"
+    "• Apply every user instruction precisely and avoid unintended changes.\n"
+    "FORMAT & STRUCTURE\n"
+    "• Always return the FULL updated body via BodyPlan.mode = \"replace\".\n"
+    "• Keep all existing text unchanged unless the user explicitly requests a modification.\n"
+    "• Separate paragraphs with a single blank line; never collapse existing line breaks.\n"
+    "GREETING & FAREWELL BY TONE\n"
+    "• friendly: greeting = \"Hello {RecipientNameOrPlaceholder},\"; farewell = \"Best regards,\\n{SenderNameOrPlaceholder}\".\n"
+    "• neutral: greeting = \"Good day {RecipientNameOrPlaceholder},\"; farewell = \"Kind regards,\\n{SenderNameOrPlaceholder}\".\n"
+    "• formal: greeting = \"Dear {RecipientNameOrPlaceholder},\"; farewell = \"Yours sincerely,\\n{SenderNameOrPlaceholder}\".\n"
+    "PLACEHOLDERS & PERSPECTIVE\n"
+    "• When required information is missing, insert descriptive placeholders in square brackets (e.g., \"[Recipient Name]\", \"[Your Name]\") rather than inventing details.\n"
+    "• Preserve existing placeholders unless the user asks for changes.\n"
+    "• Treat the drafter as first-person (I, my) and the recipient as second-person (you, your) or third-person; never swap perspectives.\n"
+    "RECIPIENTS\n"
+    "• “Mail” means the recipient (the To field).\n"
+    "• Change to/cc only when explicitly instructed.\n"
+    "• Never invent addresses and never set both to_set and to_add (same for cc).\n"
+    "SUBJECT & TONE\n"
+    "• Modify subject or tone only when requested. Do not add \"Re:\" unless the user specifies it is a reply.\n"
+    "ADDITIONAL CONTENT\n"
+    "• If the user asks to add content, append it exactly as instructed (e.g., new paragraph). If removing or editing, touch only the specified sentences.\n"
+    "• If the user says reset/start over, you may rewrite the body from scratch while still following all format rules.\n"
+    "VERBATIM VS. REPHRASING\n"
+    "• By default, NEVER insert user notes/transcripts/descriptions word-for-word. Paraphrase and integrate them into a polished, coherent email.\n"
+    "• Only insert verbatim text if it is explicitly marked as VERBATIM:, in double quotes \"...\", or inside triple backticks ```...```, or the user explicitly says to quote exactly.\n"
+    "• Do not echo meta-instructions, labels, or system text into the email body.\n"
+    "PROHIBITIONS\n"
+    "• Do not add disclaimers, warnings, or boilerplate unless explicitly requested.\n"
+    "SCHEMA\n"
+    "Plan(updates: Updates(subject?: str|null, to_set?: [EmailStr]|null, to_add?: [EmailStr]|null, "
+    "cc_set?: [EmailStr]|null, cc_add?: [EmailStr]|null, tone?: {'friendly'|'formal'|'neutral'}|null, "
+    "body?: BodyPlan(mode: 'replace'|null, text?: str|null)))\n"
+))
+
+_KEEP_ALIVE_RE = re.compile(r"^(\d+(?:\.\d+)?)([smh]?)$")
+
+def _keep_alive_seconds(value: str) -> float:
+    """Ollama keep_alive ("30m", "1h", "90s", "600") in seconds; negative = forever, unknown = 0."""
+    v = value.strip().lower()
+    if v.startswith("-"):
+        return float("inf")
+    m = _KEEP_ALIVE_RE.match(v)
+    if not m:
+        return 0.0
+    return float(m.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600}[m.group(2)]
+
+# A prefill is skipped while one is in flight, or when the model was used within half its
+# keep-alive (Ollama still has it resident, prompt cache included)
+_PREFILL_FRESH_S = _keep_alive_seconds(LLM_KEEP_ALIVE) / 2
+_PREFILL_LOCK = threading.Lock()
+_PREFILL_THREAD: Optional[threading.Thread] = None
+_LLM_LAST_USED: Dict[str, float] = {}  # model -> time.monotonic() of its last prefill/call
+
+def _mark_llm_used(model: str) -> None:
+    _LLM_LAST_USED[model] = time.monotonic()
+
+def prefill_llm() -> None:
+    """Load the model and prefill the static system prompt (one output token).
+    Uses the same num_ctx as the real calls so Ollama does not reload the model.
+    """
+    model = GLOBAL_LLM_MODEL or DEFAULT_LLM_MODEL
+    try:
+        warm = _cached_llm(model, LLM_TEMPERATURE, LLM_NUM_CTX, 1)
+        warm.invoke([SYSTEM_MSG, HumanMessage(content="ok")])
+        _mark_llm_used(model)
+    except Exception:
+        pass  # best effort; the real call will surface errors
+
+def prefill_llm_async() -> Optional[threading.Thread]:
+    """Run prefill_llm in a daemon thread, e.g. while the user is still speaking.
+    Returns None (no request) if a prefill is in flight or the model is still warm.
+    """
+    global _PREFILL_THREAD
+    model = GLOBAL_LLM_MODEL or DEFAULT_LLM_MODEL
+    with _PREFILL_LOCK:
+        if _PREFILL_THREAD is not None and _PREFILL_THREAD.is_alive():
+            return None
+        last = _LLM_LAST_USED.get(model)
+        if last is not None and time.monotonic() - last < _PREFILL_FRESH_S:
+            return None
+        t = _PREFILL_THREAD = threading.Thread(target=prefill_llm, daemon=True)
+        t.start()
+    return t
 
 # Nodes
 def transcribe_node(state: Dict) -> Dict:
     """Local STT directly in memory (no files)."""
     print("\n🎤 Recording...")
     print("   - Press ENTER to stop recording.")
+    # Overlap model load + system-prompt prefill with the recording itself
+    prefill_llm_async()
     
     try:
         audio = record_until_enter_mem(samplerate=16000)
@@ -51,18 +378,29 @@ def transcribe_node(state: Dict) -> Dict:
         user_text = input("> ").strip()
         return {"transcript": user_text}
 
-def intent_node(state: Dict) -> Dict:
+def intent_node(
+    state: Dict,
+    on_partial: Optional[Callable[[Dict[str, Any]], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> Dict:
     """
     Lets the LLM translate free/compact inputs into a structured update plan (Plan).
     Supports:
     - Free-form idea -> suggestion + extraction (subject/to/cc/tone/body)
     - Precise instructions -> targeted updates
+    The response is streamed; `on_partial` (optional) receives each partial plan dict.
+    `cancelled` (optional) is polled per chunk; once it returns True the Ollama request
+    is closed and an empty plan is returned (nothing is cached).
     """
     transcript = state.get("transcript", "").strip()
-    if not transcript:
-        return {"last_op": "noop"}
+    if not transcript or _is_noop(transcript):
+        # Empty plan so apply_node does not replay the previous turn's intent
+        return {"last_op": "noop", "intent": {"updates": {}}}
 
-    structured_llm = make_structured_llm()
+    # Precise field commands: deterministic parse, no LLM round-trip
+    fast = _fast_plan(transcript, state.get("body") or "")
+    if fast is not None:
+        return {"last_op": "intent", "intent": fast}
 
     curr_state = {
         "subject": state.get("subject", ""),
@@ -71,61 +409,59 @@ def intent_node(state: Dict) -> Dict:
         "tone": state.get("tone", "neutral"),
         "body": state.get("body", ""),
     }
+    draft_json = to_json(curr_state).decode()
+    # Model is part of the key: a template from one model is not reused for another
+    template_key = (GLOBAL_LLM_MODEL, _normalize_instruction(transcript))
 
-    # System Prompt
-    sys = SystemMessage(content=(
-        "You output a STRICT Plan (Pydantic schema). Obey all rules:\n"
-        "GENERAL\n"
-        "• Return ONLY valid Plan JSON. Use null for fields you are not changing.\n"
-        "• Apply every user instruction precisely and avoid unintended changes.\n"
-        "FORMAT & STRUCTURE\n"
-        "• Always return the FULL updated body via BodyPlan.mode = \"replace\".\n"
-        "• Keep all existing text unchanged unless the user explicitly requests a modification.\n"
-        "• Separate paragraphs with a single blank line; never collapse existing line breaks.\n"
-        "GREETING & FAREWELL BY TONE\n"
-        "• friendly: greeting = \"Hello {RecipientNameOrPlaceholder},\"; farewell = \"Best regards,\\n{SenderNameOrPlaceholder}\".\n"
-        "• neutral: greeting = \"Good day {RecipientNameOrPlaceholder},\"; farewell = \"Kind regards,\\n{SenderNameOrPlaceholder}\".\n"
-        "• formal: greeting = \"Dear {RecipientNameOrPlaceholder},\"; farewell = \"Yours sincerely,\\n{SenderNameOrPlaceholder}\".\n"
-        "PLACEHOLDERS & PERSPECTIVE\n"
-        "• When required information is missing, insert descriptive placeholders in square brackets (e.g., \"[Recipient Name]\", \"[Your Name]\") rather than inventing details.\n"
-        "• Preserve existing placeholders unless the user asks for changes.\n"
-        "• Treat the drafter as first-person (I, my) and the recipient as second-person (you, your) or third-person; never swap perspectives.\n"
-        "RECIPIENTS\n"
-        "• “Mail” means the recipient (the To field).\n"
-        "• Change to/cc only when explicitly instructed.\n"
-        "• Never invent addresses and never set both to_set and to_add (same for cc).\n"
-        "SUBJECT & TONE\n"
-        "• Modify subject or tone only when requested. Do not add \"Re:\" unless the user specifies it is a reply.\n"
-        "ADDITIONAL CONTENT\n"
-        "• If the user asks to add content, append it exactly as instructed (e.g., new paragraph). If removing or editing, touch only the specified sentences.\n"
-        "• If the user says reset/start over, you may rewrite the body from scratch while still following all format rules.\n"
-        "VERBATIM VS. REPHRASING\n"
-        "• By default, NEVER insert user notes/transcripts/descriptions word-for-word. Paraphrase and integrate them into a polished, coherent email.\n"
-        "• Only insert verbatim text if it is explicitly marked as VERBATIM:, in double quotes \"...\", or inside triple backticks ```...```, or the user explicitly says to quote exactly.\n"
-        "• Do not echo meta-instructions, labels, or system text into the email body.\n"
-        "PROHIBITIONS\n"
-        "• Do not add disclaimers, warnings, or boilerplate unless explicitly requested.\n"
-    ))
+    # Same instruction on the same draft: answer from the response cache
+    # (case is kept: quoted/VERBATIM text is inserted as spoken)
+    cache_key = (GLOBAL_LLM_MODEL, " ".join(transcript.split()), draft_json)
+    cached = _INTENT_CACHE.get(cache_key)
+    if cached is None:
+        # Recurring draft-independent instruction: reuse the earlier plan
+        cached = _PLAN_TEMPLATES.get(template_key)
+        if cached is not None and not _template_applies(cached, state):
+            cached = None
+    # Persistent cache (opt-in): keyed by everything that determines the response
+    disk_key = (GLOBAL_LLM_MODEL, LLM_TEMPERATURE, SYSTEM_MSG.content, cache_key[1], draft_json)
+    if cached is None:
+        cached = _DISK_PLAN_CACHE.get(disk_key)
+        if cached is not None:
+            _INTENT_CACHE.put(cache_key, cached)
+    if cached is not None:
+        return {"last_op": "intent", "intent": cached}
 
-    # User Prompt
+    structured_llm = make_structured_llm()
+
+    # User Prompt (only the per-turn parts; all rules live in SYSTEM_MSG)
     user = HumanMessage(content=(
-        "Schema: Plan(updates: Updates(subject?: str|null, to_set?: [EmailStr]|null, to_add?: [EmailStr]|null, "
-        "cc_set?: [EmailStr]|null, cc_add?: [EmailStr]|null, tone?: {'friendly'|'formal'|'neutral'}|null, "
-        "body?: BodyPlan(mode: 'replace'|null, text?: str|null)))\n\n"
-        "Follow all SYSTEM rules and these reminders:\n"
-        "• Current Draft shows the exact text you must minimally update.\n"
-        "• Respect the tone-specific greeting and farewell; use placeholders when a name is missing.\n"
-        "• Maintain all unchanged text, line breaks, and placeholders unless the user explicitly alters them.\n"
-        "• Use BodyPlan.mode = \"replace\" with the full updated body.\n"
-        "• Never set both to_set and to_add (or cc_set and cc_add) simultaneously.\n\n"
-        "• Treat Input (notes/transcript/description) as material to PARAPHRASE and integrate; do NOT copy wording verbatim unless explicitly marked.\n"
-        "• Verbatim is allowed ONLY when text is marked VERBATIM:, in double quotes \"...\", or inside triple backticks ```...```.\n\n"
-        f"Current Draft: {curr_state}\n\n"
+        "Follow all SYSTEM rules. Current Draft shows the exact text you must minimally update.\n\n"
+        f"Current Draft: {draft_json}\n\n"
         f"Input: {transcript}"
     ))
 
-    plan: Plan = structured_llm.invoke([sys, user]) # Outputs Plan-object
-    return {"last_op": "intent", "intent": plan.model_dump()}
+    # Stream so callers can render progress before generation finishes
+    last = None
+    stream = structured_llm.stream([SYSTEM_MSG, user])
+    try:
+        for chunk in stream:
+            if cancelled is not None and cancelled():
+                # Closing the generator closes the HTTP response, so Ollama stops generating
+                return {"last_op": "noop", "intent": {"updates": {}}}
+            last = chunk
+            if on_partial is not None:
+                on_partial(_as_dict(chunk))
+    finally:
+        stream.close()
+    if last is None:
+        last = structured_llm.invoke([SYSTEM_MSG, user])
+    _mark_llm_used(GLOBAL_LLM_MODEL or DEFAULT_LLM_MODEL)
+    plan = PLAN_ADAPTER.validate_python(_as_dict(last))
+    plan_dict = PLAN_ADAPTER.dump_python(plan, exclude_none=True)
+    _INTENT_CACHE.put(cache_key, plan_dict)
+    _DISK_PLAN_CACHE.put(disk_key, plan)
+    _store_plan_template(template_key, plan_dict, state)
+    return {"last_op": "intent", "intent": plan_dict}
 
 def apply_node(state: Dict) -> Dict:
     """
@@ -151,33 +487,21 @@ def apply_node(state: Dict) -> Dict:
     cc_set = updates.get("cc_set")
     cc_add = updates.get("cc_add")
 
-    def clean_emails(lst):
-        if not isinstance(lst, list):
-            return []
-        cleaned = []
-        for e in lst:
-            if isinstance(e, str):
-                s = e.strip().lower()
-                if EMAIL_RE.fullmatch(s):
-                    cleaned.append(s)
-        # dedupe preserving order
-        return list(dict.fromkeys(cleaned))
-
     if isinstance(to_add, list) and to_add:
-        cleaned = clean_emails(curr_to + to_add)
+        cleaned = _clean_emails(curr_to, to_add)
         if cleaned:
             out["to"] = cleaned
     elif isinstance(to_set, list):
-        cleaned = clean_emails(to_set)
+        cleaned = _clean_emails(to_set)
         if cleaned:
             out["to"] = cleaned
     
     if isinstance(cc_add, list) and cc_add:
-        cleaned = clean_emails(curr_cc + cc_add)
+        cleaned = _clean_emails(curr_cc, cc_add)
         if cleaned:
             out["cc"] = cleaned
     elif isinstance(cc_set, list):
-        cleaned = clean_emails(cc_set)
+        cleaned = _clean_emails(cc_set)
         if cleaned:
             out["cc"] = cleaned
 
@@ -194,11 +518,15 @@ def apply_node(state: Dict) -> Dict:
     if isinstance(text, str) and text.strip():
         if mode == "replace":
             out["body"] = text.strip()
-    
-    return out
+
+    # Field-level delta: drop values identical to the current state so unchanged
+    # fields are neither re-merged by the graph nor re-rendered by the UI
+    return {k: v for k, v in out.items() if v != state.get(k)}
 
 def decide_node(state: Dict) -> Dict:
     """MVP: CLI/UX-Decision: 1=continue editing, 2=finished. Needs to be updated for UI."""
+    # No re-warming here: the turn just used both models (Whisper stays cached in-process,
+    # Ollama keeps the LLM loaded for LLM_KEEP_ALIVE)
     print("\nAction: [1] continue   [2] exit")
     choice = input("Choose 1 or 2: ").strip()
     return {"done": choice == "2"}
\ No newline at end of file
@@ -1,14 +1,18 @@
 from typing import List, Optional, Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 Tone = Literal["friendly", "formal", "neutral"]
 BodyMode = Literal["replace"] # For now only replace (experiment with other modes later)
 
 class BodyPlan(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     mode: Optional[BodyMode]
     text: Optional[str]
 
 class Updates(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     body: Optional[BodyPlan]
     subject: Optional[str]
     to_set: Optional[List[str]]
@@ -18,4 +22,10 @@ class Updates(BaseModel):
     tone: Optional[Tone]
 
 class Plan(BaseModel):
-    updates: Updates
\ No newline at end of file
+    model_config = ConfigDict(extra="ignore")
+
+    updates: Updates
+
+# Built once at import; reused for the LLM schema and for validating/dumping plans
+PLAN_ADAPTER = TypeAdapter(Plan)
+PLAN_JSON_SCHEMA = PLAN_ADAPTER.json_schema()
@@ -13,7 +13,8 @@ a = Analysis(
     pathex=[],
     binaries=binaries,
     datas=[('ui/icons', 'ui/icons'), ('img', 'img')],
-    hiddenimports=['AVFoundation'],
+    # agent.nodes / utils.stt_whisper_mem are imported lazily via importlib in ui/app.py
+    hiddenimports=['AVFoundation', 'agent.nodes', 'utils.stt_whisper_mem'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -8,7 +8,6 @@ except Exception:
     pass
 
 from agent.state import initial_state
-from agent.graph import build_graph
 from ui.app import main
 
 # Only for Running with CLI/Debug
@@ -23,6 +22,9 @@ def print_state(state):
 
 # CLI-Mode
 def chat_session():
+    # Imported here: agent.graph pulls in agent.nodes (LangChain/LangGraph, faster-whisper),
+    # which the UI loads lazily after the window is up
+    from agent.graph import build_graph
     app = build_graph()
 
     print("\n📧 LangGraph Mail-Drafter (MVP) – structured output\n")
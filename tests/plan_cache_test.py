@@ -0,0 +1,19 @@
+import tempfile
+from agent.nodes import _DiskPlanCache
+from agent.schema import PLAN_ADAPTER
+
+# To Run: uv run -m tests.plan_cache_test
+if __name__ == "__main__":
+    plan = PLAN_ADAPTER.validate_python({"updates": {
+        "body": None, "subject": "Quarterly report", "to_set": None, "to_add": ["anna@example.com"],
+        "cc_set": None, "cc_add": None, "tone": "formal",
+    }})
+    key = ("qwen3:8b", "set the subject to quarterly report", "{}")
+
+    with tempfile.TemporaryDirectory() as root:
+        cache = _DiskPlanCache(root)
+        cache.put(key, plan)
+        hit = cache.get(key)
+
+    assert hit == PLAN_ADAPTER.dump_python(plan, exclude_none=True), hit
+    print("Disk plan cache round-trip OK:", hit)
@@ -7,7 +7,7 @@ if __name__ == "__main__":
     out_dir = Path(__file__).resolve().parent.parent / "img"
     out_file = out_dir / "graph.png"
 
-    app = build_graph()
+    app = build_graph(warmup=False)
 
     with open(out_file, "wb") as f:
         f.write(app.get_graph().draw_mermaid_png(max_retries=5, retry_delay=2.0))
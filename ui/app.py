@@ -1,21 +1,66 @@
 import sys
 import os
 import re
+import atexit
+import importlib
+import logging
+import logging.handlers
+import math
+import queue
+import threading
+import time
 from typing import Dict, Any
-from PySide6.QtCore import Qt, QObject, QThread, Signal, QSize, QTimer, QEvent, QPropertyAnimation, QPoint
-from PySide6.QtGui import QFont, QAction, QPalette, QColor, QIcon, QTextOption, QPainter, QPen, QBrush, QPainterPath, QShortcut, QKeySequence
+from PySide6.QtCore import Qt, QObject, QThread, Signal, Slot, QSize, QTimer, QEvent, QVariantAnimation, QEasingCurve, QPoint, QPointF
+from PySide6.QtGui import QFont, QAction, QPalette, QColor, QIcon, QPixmap, QTextCursor, QTextOption, QPainter, QPen, QBrush, QPainterPath, QStaticText
 from PySide6.QtWidgets import (
 QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-QLineEdit, QPlainTextEdit, QTextEdit, QPushButton, QScrollArea, QFrame, QToolButton,
+QLineEdit, QTextEdit, QPushButton, QScrollArea, QFrame, QToolButton,
 QDialog, QDialogButtonBox, QSizePolicy, QAbstractButton, QComboBox, QFormLayout, QSpacerItem
 )
 import subprocess
-from PySide6.QtWidgets import QGraphicsOpacityEffect
 import numpy as np
 from agent.state import initial_state, DraftState
-from agent.nodes import intent_node, apply_node
-from agent import nodes as nodes_mod
-from utils.stt_whisper_mem import transcribe_array, set_whisper_model
+log = logging.getLogger("mailwhisper")
+
+def _setup_logging():
+    """Send app logs to stderr from a listener thread, so the GUI thread never blocks on I/O."""
+    q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(q, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    log.addHandler(logging.handlers.QueueHandler(q))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+# agent.nodes (LangChain/Ollama) and utils.stt_whisper_mem (faster-whisper/CTranslate2)
+# are heavy; they are imported on first use so the window can show first, and
+# main() preloads them on a background thread in the meantime.
+_HEAVY_MODULES = ("agent.nodes", "utils.stt_whisper_mem")
+
+def _lazy(module: str, attr: str):
+    def call(*args, **kwargs):
+        return getattr(importlib.import_module(module), attr)(*args, **kwargs)
+    call.__name__ = attr
+    return call
+
+def _nodes_mod():
+    return importlib.import_module("agent.nodes")
+
+def _preload_heavy_modules():
+    for name in _HEAVY_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # Surface the real error on first use instead
+            pass
+
+intent_node = _lazy("agent.nodes", "intent_node")
+apply_node = _lazy("agent.nodes", "apply_node")
+transcribe_array = _lazy("utils.stt_whisper_mem", "transcribe_array")
+set_whisper_model = _lazy("utils.stt_whisper_mem", "set_whisper_model")
+warmup_whisper = _lazy("utils.stt_whisper_mem", "warmup_whisper")
 from ui.recorder import ButtonControlledRecorder
 
 def resource_path(rel: str) -> str:
@@ -27,23 +72,93 @@ def resource_path(rel: str) -> str:
     root = os.path.dirname(here)
     return os.path.join(root, rel)
 
+# Event types compared in event filters, looked up once instead of per dispatch
+_EV_RESIZE = QEvent.Type.Resize
+_EV_ENTER = QEvent.Type.Enter
+_EV_LEAVE = QEvent.Type.Leave
+_EV_PRESS = QEvent.Type.MouseButtonPress
+_EV_KEY_PRESS = QEvent.Type.KeyPress
+
+# Icons/fonts are shared across widgets: decode each SVG once per process.
+# Filled lazily, since Qt must have a QApplication before creating them.
+_ICON_CACHE: dict[str, QIcon] = {}
+_LOGO_FONT: QFont | None = None
+
+def _icon(rel: str) -> QIcon:
+    icon = _ICON_CACHE.get(rel)
+    if icon is None:
+        icon = _ICON_CACHE[rel] = QIcon(resource_path(rel))
+    return icon
+
+def _copy_icon() -> QIcon:
+    """Copy icon, switching to a check mark while the button is checked."""
+    icon = _ICON_CACHE.get("copy+check")
+    if icon is None:
+        icon = _ICON_CACHE["copy+check"] = QIcon()
+        icon.addFile(resource_path("ui/icons/copy.svg"), QSize(), QIcon.Normal, QIcon.Off)
+        icon.addFile(resource_path("ui/icons/check.svg"), QSize(), QIcon.Normal, QIcon.On)
+    return icon
+
+def _logo_font() -> QFont:
+    global _LOGO_FONT
+    if _LOGO_FONT is None:
+        _LOGO_FONT = QFont()
+        _LOGO_FONT.setPointSize(16)
+        _LOGO_FONT.setWeight(QFont.DemiBold)
+    return _LOGO_FONT
+
+# Draft fields intent_node/apply_node read; everything else in state stays on the UI side
+_NODE_KEYS = ("to", "cc", "subject", "tone", "body")
+
 class ProcessAudioWorker(QObject):
+    """Long-lived worker living on its own QThread; one `process` call per recording."""
     finished = Signal(dict) # emits patch for state update
+    partial = Signal(dict)  # display-only preview while the LLM is streaming
     failed = Signal(str)
 
-    def __init__(self, audio: np.ndarray, samplerate: int, state: Dict[str, Any]):
+    def __init__(self):
         super().__init__()
-        self.audio = audio
-        self.samplerate = samplerate
-        self.state_snapshot = dict(state)  # shallow copy
+        self.audio: np.ndarray | None = None
+        self.samplerate = 16000
+        self._state_snap: Dict[str, Any] = {}
+        self._cancelled = False
+
+    def reset(self):
+        """Clear the cancel flag; called from the UI thread before queueing a job."""
         self._cancelled = False
 
     def cancel(self):
         self._cancelled = True
 
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    @Slot(object, int, object)
+    def process(self, audio: np.ndarray, samplerate: int, state: Dict[str, Any]):
+        self.audio = audio
+        self.samplerate = samplerate
+        # Snapshot taken on the GUI thread at enqueue time; owned by this job
+        self._state_snap = state
+        try:
+            self.run()
+        finally:
+            self.audio = None
+
+    def _on_partial_transcript(self, text: str):
+        if not self._cancelled:
+            self.partial.emit({"transcript": text})
+
+    def _on_partial_plan(self, plan: Dict[str, Any]):
+        body = ((plan.get("updates") or {}).get("body") or {}).get("text")
+        if isinstance(body, str) and body.strip() and not self._cancelled:
+            self.partial.emit({"body": body})
+
     def run(self):
         try:
-            text, detected_lang = transcribe_array(self.audio, samplerate=self.samplerate)
+            # Raw recorder output: transcribe_array normalizes it (prepare_audio in utils.stt_whisper_mem)
+            text, detected_lang = transcribe_array(
+                self.audio, samplerate=self.samplerate, on_segment=self._on_partial_transcript
+            )
             text = (text or "").strip()
             if not text:
                 self.failed.emit("No Transcription recognized.")
@@ -53,26 +168,26 @@ class ProcessAudioWorker(QObject):
                 return
 
             # 1) set transcript
-            self.state_snapshot["transcript"] = text
+            snap = self._state_snap
+            snap["transcript"] = text
 
             # 2) determine intent (LLM)
             if self._cancelled:
                 patch_intent = {}
             else:
-                patch_intent = intent_node(self.state_snapshot)
-            self.state_snapshot.update(patch_intent)  # last_op, intent
+                patch_intent = intent_node(
+                    snap, on_partial=self._on_partial_plan, cancelled=self.is_cancelled
+                )
+            snap.update(patch_intent or {})  # last_op, intent
 
             # 3) apply to draft
             if self._cancelled:
                 patch_apply = {}
             else:
-                patch_apply = apply_node(self.state_snapshot)
+                patch_apply = apply_node(snap)
 
             # Combine: return intent+apply (UI primarily needs apply fields)
-            patch = {}
-            patch.update(patch_intent or {})
-            patch.update(patch_apply or {})
-            self.finished.emit(patch)
+            self.finished.emit({**(patch_intent or {}), **(patch_apply or {})})
 
         except Exception as e:
             self.failed.emit(str(e))
@@ -92,8 +207,21 @@ class StopAudioWorker(QObject):
         except Exception as e:
             self.failed.emit(str(e))
 
+class WarmupWorker(QObject):
+    """Loads Whisper and the LLM in the background so the first recording is fast."""
+    finished = Signal()
+
+    def run(self):
+        try:
+            warmup_whisper()
+            _nodes_mod().prefill_llm()
+            # Settings opens instantly with the real model list
+            _list_ollama_models()
+        finally:
+            self.finished.emit()
+
 class FieldCard(QWidget):
-    def __init__(self, title: str, multiline: bool = False, parent=None):
+    def __init__(self, title: str, multiline: bool = False, parent=None, soft_tip: "SoftToolTip | None" = None):
         super().__init__(parent)
         self.setObjectName("card")
         outer = QVBoxLayout(self)
@@ -111,10 +239,9 @@ class FieldCard(QWidget):
         self.copy_btn.setObjectName("copyBtn")
         # Use custom SoftToolTip; keep native tooltip empty
         self.copy_btn.setToolTip("")
-        self.copy_btn.setProperty("softTip", "Copy")
-        self._copy_icon = QIcon(resource_path("ui/icons/copy.svg"))
-        self._check_icon = QIcon(resource_path("ui/icons/check.svg"))
-        self.copy_btn.setIcon(self._copy_icon)
+        # Checked = "Copied!" feedback; the icon's On state is the check mark
+        self.copy_btn.setCheckable(True)
+        self.copy_btn.setIcon(_copy_icon())
         self.copy_btn.setIconSize(QSize(18, 18))
         self.copy_btn.setText("")
 
@@ -132,6 +259,13 @@ class FieldCard(QWidget):
             self.editor = QLineEdit()
             self.editor.setReadOnly(True)
             self.editor.setMinimumHeight(32)
+        # Resolve text accessors once (QTextEdit vs QLineEdit) instead of per call
+        if isinstance(self.editor, QTextEdit):
+            self._set_fn = self.editor.setPlainText
+            self._get_fn = self.editor.toPlainText
+        else:
+            self._set_fn = self.editor.setText
+            self._get_fn = self.editor.text
 
         grid.addWidget(self.title_lbl, 0, 0, alignment=Qt.AlignTop | Qt.AlignRight)
         grid.addWidget(self.editor,    0, 1)
@@ -146,47 +280,45 @@ class FieldCard(QWidget):
         self._tip_timer = QTimer(self)
         self._tip_timer.setSingleShot(True)
         self._tip_timer.timeout.connect(self._show_copy_tip)
-        self._soft_tip = SoftToolTip(self)
+        # Cards normally share the main window's tooltip (one top-level window for all)
+        self._soft_tip = soft_tip or SoftToolTip(self)
+        # One reusable timer for the "Copied!" feedback; restarting it extends the window
+        self._restore_timer = QTimer(self)
+        self._restore_timer.setSingleShot(True)
+        self._restore_timer.setInterval(1500)
+        self._restore_timer.timeout.connect(lambda: self.copy_btn.setChecked(False))
 
     def set_text(self, text: str):
+        # Auto-resizing editors schedule their own height update on textChanged
+        self._set_fn(text or "")
+
+    def append_text(self, delta: str):
+        """Append at the end; only the new text is laid out (multiline cards only)."""
         e = self.editor
-        t = text or ""
-        # Prefer setPlainText when available (QTextEdit/QPlainTextEdit)
-        if hasattr(e, "setPlainText") and not isinstance(e, QLineEdit):
-            e.setPlainText(t)
-        else:
-            e.setText(t)
-        # Trigger height recompute for auto-resizing widgets
-        if hasattr(e, "update_height"):
-            QTimer.singleShot(0, e.update_height)
+        if not isinstance(e, QTextEdit):
+            self._set_fn(self._get_fn() + delta)
+            return
+        cursor = QTextCursor(e.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(delta)
 
     def text(self) -> str:
-        # Prefer plain text if available (covers QTextEdit/QPlainTextEdit)
         try:
-            if hasattr(self.editor, "toPlainText") and not isinstance(self.editor, QLineEdit):
-                return self.editor.toPlainText()
-            if hasattr(self.editor, "text"):
-                return self.editor.text()
+            return self._get_fn()
         except Exception:
-            pass
-        return ""
+            return ""
 
     def _on_copy_clicked(self):
         # Copy current text to clipboard
         QApplication.clipboard().setText(self.text())
-        # Feedback: swap icon to check for 1.5s
-        self.copy_btn.setIcon(self._check_icon)
-        self.copy_btn.setProperty("softTip", "Copied!")
-        QTimer.singleShot(1500, self._restore_copy_icon)
-
-    def _restore_copy_icon(self):
-        self.copy_btn.setIcon(self._copy_icon)
-        self.copy_btn.setProperty("softTip", "Copy")
+        # Feedback: check mark for 1.5s (a click while checked toggled it off; re-check)
+        self.copy_btn.setChecked(True)
+        self._restore_timer.start()
 
     # Soft tooltip helpers for copy button
     def _show_copy_tip(self):
         try:
-            text = self.copy_btn.property("softTip") or "Copy"
+            text = "Copied!" if self.copy_btn.isChecked() else "Copy"
             self._soft_tip.setText(text)
             self._soft_tip.showNear(self.copy_btn, above=True, y_offset=10)
         except Exception:
@@ -194,68 +326,15 @@ class FieldCard(QWidget):
 
     def eventFilter(self, obj, event):
         if obj is self.copy_btn:
-            if event.type() == QEvent.Enter:
+            et = event.type()
+            if et == _EV_ENTER:
                 self._tip_timer.start(600)
-            elif event.type() in (QEvent.Leave, QEvent.MouseButtonPress):
+            elif et == _EV_LEAVE or et == _EV_PRESS:
                 self._tip_timer.stop()
                 self._soft_tip.hide()
         return super().eventFilter(obj, event)
 
 
-class AutoResizingPlainTextEdit(QPlainTextEdit):
-    """A read-only QPlainTextEdit that grows with its content and never shows
-    inner scrollbars. The outer QScrollArea handles scrolling.
-    """
-    def __init__(self, min_height: int = 160, parent: QWidget | None = None):
-        super().__init__(parent)
-        self._min_height = min_height
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        # Enable wrapping to widget width
-        try:
-            self.setLineWrapMode(QPlainTextEdit.WidgetWidth)
-        except Exception:
-            pass
-        self.setWordWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-        # Recompute height when content changes
-        self.document().contentsChanged.connect(self.update_height)
-        try:
-            self.document().documentLayout().documentSizeChanged.connect(lambda _=None: self.update_height())
-        except Exception:
-            pass
-        # Ensure first layout pass updates height after widget is shown
-        QTimer.singleShot(0, self.update_height)
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        # Ensure layout width tracks viewport width for correct doc height
-        self.document().setTextWidth(self.viewport().width())
-        self.update_height()
-
-    def update_height(self):
-        # Calculate document height and set widget height accordingly
-        # Determine effective content width
-        vw = self.viewport().width()
-        if vw <= 0:
-            vw = max(0, self.width() - self.frameWidth() * 2 - 4)
-        self.document().setTextWidth(vw)
-        # Compute document height
-        layout = self.document().documentLayout()
-        doc_size = layout.documentSize()
-        doc_h = int(doc_size.height())
-        frame = self.frameWidth() * 2
-        pad = 12  # small breathing space
-        target = max(self._min_height, doc_h + frame + pad)
-        # Enforce exact height so inner scrolling never appears
-        self.setMinimumHeight(target)
-        self.setMaximumHeight(target)
-
-    def wheelEvent(self, event):
-        """Avoid inner scrolling; let the outer scroll area handle the wheel."""
-        event.ignore()
-
-
 class AutoResizingTextEdit(QTextEdit):
     """Read-only QTextEdit that wraps to widget width and auto-resizes
     to its content height. No inner scrollbars; outer scroll handles scrolling.
@@ -270,28 +349,39 @@ class AutoResizingTextEdit(QTextEdit):
         self.setLineWrapMode(QTextEdit.WidgetWidth)
         self.setWordWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-        # Signals to react on content/size changes
-        self.textChanged.connect(self.update_height)
-        try:
-            self.document().documentLayout().documentSizeChanged.connect(lambda _=None: self.update_height())
-        except Exception:
-            pass
-        QTimer.singleShot(0, self.update_height)
+        # React on content changes, rate-limited to ~one frame
+        self._height_timer = QTimer(self)
+        self._height_timer.setSingleShot(True)
+        self._height_timer.setInterval(16)
+        self._height_timer.timeout.connect(self.update_height)
+        self._last_text_width = -1
+        self._last_target = -1
+        self.textChanged.connect(self.schedule_update_height)
+        self.schedule_update_height()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        # Match text width to viewport width for correct wrapping height
-        self.document().setTextWidth(self.viewport().width())
+        # update_height matches text width to viewport width for correct wrapping
         self.update_height()
 
+    def schedule_update_height(self):
+        # Restartable: a burst of changes yields one recompute per frame
+        self._height_timer.start()
+
     def update_height(self):
         vw = self.viewport().width()
         if vw <= 0:
             vw = max(0, self.width() - self.frameWidth() * 2 - 4)
-        self.document().setTextWidth(vw)
+        # setTextWidth invalidates the whole layout even for the same width
+        if vw != self._last_text_width:
+            self.document().setTextWidth(vw)
+            self._last_text_width = vw
         layout = self.document().documentLayout()
         doc_size = layout.documentSize()
         h = max(self._min_height, int(doc_size.height()) + self.frameWidth() * 2 + 2)
+        if h == self._last_target:
+            return
+        self._last_target = h
         self.setMinimumHeight(h)
         self.setMaximumHeight(h)
         self.updateGeometry()
@@ -300,39 +390,6 @@ class AutoResizingTextEdit(QTextEdit):
         # Avoid inner scrolling; let outer scroll area handle it
         event.ignore()
 
-class AutoWrapLabel(QLabel):
-    """A selectable, word-wrapping label that grows with its content and never
-    shows inner scrollbars. Lets the outer scroll area handle scrolling."""
-    def __init__(self, parent: QWidget | None = None):
-        super().__init__(parent)
-        self.setWordWrap(True)
-        self.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-        # Use zero contents margins; padding is controlled via QSS for consistency
-        self.setContentsMargins(0, 0, 0, 0)
-
-    def setText(self, text: str) -> None:
-        super().setText(text or "")
-        QTimer.singleShot(0, self._adjust_height)
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        QTimer.singleShot(0, self._adjust_height)
-
-    def _adjust_height(self):
-        # Compute height based on the current available width for proper wrapping
-        w = self.width()
-        if w <= 0 and self.parent() is not None:
-            w = max(0, self.parent().width() - 16)
-        if w <= 0:
-            w = self.sizeHint().width()
-        # QLabel provides heightForWidth when wordWrap is enabled
-        h_text = self.heightForWidth(w) if self.wordWrap() else self.sizeHint().height()
-        h = max(60, h_text)
-        self.setMinimumHeight(h)
-        self.setMaximumHeight(h)
-
-
 class SoftToolTip(QWidget):
     """A lightweight, custom tooltip to avoid native borders/shadows."""
     def __init__(self, parent=None):
@@ -384,6 +441,39 @@ class SoftToolTip(QWidget):
             p.end()
 
 
+class TypingLabel(QWidget):
+    """Centered, word-wrapped text via QStaticText; setText only repaints (no QLabel relayout)."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._st = QStaticText()
+        self._st.setTextFormat(Qt.PlainText)
+        self._st.setTextOption(QTextOption(Qt.AlignHCenter))
+
+    def setText(self, text: str):
+        self._st.setText(text or "")
+        self.update()
+
+    def text(self) -> str:
+        return self._st.text()
+
+    def resizeEvent(self, event):
+        self._st.setTextWidth(self.width())
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if not self._st.text():
+            return
+        p = QPainter(self)
+        p.setFont(self.font())
+        p.setPen(self.palette().color(self.foregroundRole()))
+        y = (self.height() - self._st.size().height()) / 2
+        p.drawStaticText(QPointF(0, y), self._st)
+        p.end()
+
+_SPINNER_STEP = 6  # degrees per tick
+# Rotated spinner frames, rasterized on first use per color/size/scale and shared
+_SPINNER_FRAMES: dict[tuple, list[QPixmap | None]] = {}
+
 class Spinner(QWidget):
     """Tiny, smooth progress spinner (indeterminate)."""
     def __init__(self, parent=None, diameter: int = 14, line_width: int = 2, color: QColor | str = "#ffffff"):
@@ -392,55 +482,85 @@ class Spinner(QWidget):
         self._lw = int(line_width)
         self._color = QColor(color)
         self._angle = 0
+        self._running = False
         self.setFixedSize(self._diam, self._diam)
         self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self._path = self._arc_path((self._diam - self._lw) / 2.0)
+        self._pen = QPen(self._color)
+        self._pen.setWidth(self._lw)
+        self._pen.setCapStyle(Qt.RoundCap)
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._tick)
         self._timer.setInterval(33)  # ~30 FPS is smoother and lighter
 
     def start(self):
+        self._running = True
         if not self._timer.isActive():
             self._timer.start()
         self.show()
 
     def stop(self):
+        self._running = False
         if self._timer.isActive():
             self._timer.stop()
         self.hide()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._running and not self._timer.isActive():
+            self._timer.start()
+
+    def hideEvent(self, event):
+        # Hidden with its container or a minimized window: no timer wakeups for unseen frames
+        self._timer.stop()
+        super().hideEvent(event)
+
     def _tick(self):
-        self._angle = (self._angle + 6) % 360  # 60fps * 6deg = full rotation in 1s
+        self._angle = (self._angle + _SPINNER_STEP) % 360  # 30fps * 6deg = full rotation in 2s
         self.update()
 
-    def paintEvent(self, event):
-        p = QPainter(self)
-        try:
+    @staticmethod
+    def _arc_path(r: float) -> QPainterPath:
+        # 280-degree arc (leaves a gap) as incremental lines, centred on the origin
+        path = QPainterPath()
+        steps = 40
+        for i in range(steps + 1):
+            a = math.radians(280 * (i / steps))
+            x = r * math.cos(a)
+            y = r * math.sin(a)
+            if i == 0:
+                path.moveTo(x, y)
+            else:
+                path.lineTo(x, y)
+        return path
+
+    def _frame(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        key = (self._color.rgba(), self._diam, self._lw, dpr)
+        frames = _SPINNER_FRAMES.get(key)
+        if frames is None:
+            frames = _SPINNER_FRAMES[key] = [None] * (360 // _SPINNER_STEP)
+        i = self._angle // _SPINNER_STEP
+        pm = frames[i]
+        if pm is None:
+            side = max(1, round(self._diam * dpr))
+            pm = QPixmap(side, side)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            p = QPainter(pm)
             p.setRenderHint(QPainter.Antialiasing, True)
-            p.translate(self.width() / 2, self.height() / 2)
+            p.translate(self._diam / 2, self._diam / 2)
             p.rotate(self._angle)
-            pen = QPen(self._color)
-            pen.setWidth(self._lw)
-            pen.setCapStyle(Qt.RoundCap)
-            p.setPen(pen)
-            r = (min(self.width(), self.height()) - self._lw) / 2.0
-            # Draw 280-degree arc to create a gap
-            start_angle = 0
-            span_angle = 280
-            # Convert to radians along circle via incremental lines for simplicity
-            path = QPainterPath()
-            from math import cos, sin, radians
-            steps = 40
-            for i in range(steps + 1):
-                a = radians(start_angle + span_angle * (i / steps))
-                x = r * cos(a)
-                y = r * sin(a)
-                if i == 0:
-                    path.moveTo(x, y)
-                else:
-                    path.lineTo(x, y)
-            p.drawPath(path)
-        finally:
+            p.setPen(self._pen)
+            p.drawPath(self._path)
             p.end()
+            frames[i] = pm
+        return pm
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._frame())
+        p.end()
 
 
 class Toast(QWidget):
@@ -455,21 +575,9 @@ class Toast(QWidget):
         self._radius = 10
         self._duration = max(1200, int(duration_ms))
         # Colors
-        self._bg = QColor("#ffffff")
         self._fg = QColor("#1f2937")
         self._border = QColor("#e6e6e6")
-        # Accent + lightly tinted backgrounds
-        if kind in ("info", "warning"):
-            self._accent = QColor("#f59e0b")  # orange
-            self._bg = QColor("#FFF7ED")     # light orange tint
-        elif kind == "success":
-            self._accent = QColor("#22c55e")  # green
-            self._bg = QColor("#ECFDF5")      # light green tint
-        elif kind == "error":
-            self._accent = QColor("#ef4444")  # red
-            self._bg = QColor("#FEF2F2")      # light red tint
-        else:
-            self._accent = QColor("#9ca3af")  # gray fallback
+        self._set_kind(kind)
 
         lay = QHBoxLayout(self)
         lay.setContentsMargins(12, 8, 12, 8)
@@ -477,43 +585,97 @@ class Toast(QWidget):
         self._label = QLabel(text)
         self._label.setWordWrap(True)
         self._label.setStyleSheet("color: #1f2937;")
+        # The label is hidden while fading (its pixels are in the snapshot); keep the layout size
+        sp = self._label.sizePolicy()
+        sp.setRetainSizeWhenHidden(True)
+        self._label.setSizePolicy(sp)
         lay.addWidget(self._label)
 
-        self._fx = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self._fx)
-        self._fx.setOpacity(0.0)
-        self._fade = QPropertyAnimation(self._fx, b"opacity", self)
+        # Fades draw one pre-rendered snapshot with a per-frame alpha, instead of an
+        # opacity effect re-rendering the widget offscreen on every frame
+        self._alpha = 0.0
+        self._snapshot: QPixmap | None = None
+        self._closing = False
+        self._fade = QVariantAnimation(self)
         self._fade.setDuration(180)
+        self._fade.valueChanged.connect(self._set_alpha)
+        self._fade.finished.connect(self._on_fade_finished)
 
         # Auto dismiss timers
         self._hold = QTimer(self)
         self._hold.setSingleShot(True)
         self._hold.timeout.connect(self._fade_out)
 
-    def show_with_fade(self):
-        self.adjustSize()
+    def _set_kind(self, kind: str):
+        # Accent + lightly tinted backgrounds
+        if kind in ("info", "warning"):
+            self._accent = QColor("#f59e0b")  # orange
+            self._bg = QColor("#FFF7ED")     # light orange tint
+        elif kind == "success":
+            self._accent = QColor("#22c55e")  # green
+            self._bg = QColor("#ECFDF5")      # light green tint
+        elif kind == "error":
+            self._accent = QColor("#ef4444")  # red
+            self._bg = QColor("#FEF2F2")      # light red tint
+        else:
+            self._accent = QColor("#9ca3af")  # gray fallback
+            self._bg = QColor("#ffffff")
+
+    def show_message(self, text: str, kind: str = "info", duration_ms: int = 3000):
+        """Reuse this toast for a new message (replaces whatever it currently shows)."""
+        self._hold.stop()
+        self._fade.stop()
+        self._set_kind(kind)
+        self._duration = max(1200, int(duration_ms))
+        self._label.setText(text)
+        # Fresh snapshot of the new content, faded in from transparent
+        self._closing = False
+        self._snapshot = None
+        self._label.show()
+        self._alpha = 0.0
+        self.show_with_fade()
+
+    def _start_fade(self, end: float, duration: int):
         self._fade.stop()
-        self._fade.setStartValue(0.0)
-        self._fade.setEndValue(1.0)
+        if self._snapshot is None:
+            self._snapshot = self.grab()
+            self._label.hide()
+        self._fade.setStartValue(self._alpha)
+        self._fade.setEndValue(end)
+        self._fade.setDuration(duration)
         self._fade.start()
+
+    def _set_alpha(self, value):
+        self._alpha = float(value)
+        self.update()
+
+    def _on_fade_finished(self):
+        if self._closing:
+            # Kept for reuse by show_message
+            self.hide()
+            self.closed.emit(self)
+            return
+        # Fully shown: back to live painting
+        self._snapshot = None
+        self._label.show()
+
+    def show_with_fade(self):
+        self.adjustSize()
+        self._start_fade(1.0, 180)
         self.show()
         self._hold.start(self._duration)
 
     def _fade_out(self):
-        self._fade.stop()
-        self._fade.setStartValue(self._fx.opacity())
-        self._fade.setEndValue(0.0)
-        self._fade.setDuration(200)
-        def _done():
-            self.closed.emit(self)
-            self.hide()
-            self.deleteLater()
-        self._fade.finished.connect(_done)
-        self._fade.start()
+        self._closing = True
+        self._start_fade(0.0, 200)
 
     def paintEvent(self, event):
         p = QPainter(self)
         try:
+            if self._snapshot is not None:
+                p.setOpacity(self._alpha)
+                p.drawPixmap(0, 0, self._snapshot)
+                return
             p.setRenderHint(QPainter.Antialiasing, True)
             rect = self.rect().adjusted(0, 0, -1, -1)
             path = QPainterPath()
@@ -526,6 +688,83 @@ class Toast(QWidget):
         finally:
             p.end()
 
+# `ollama list` result, shared by all SettingsDialog opens; refreshed off the GUI thread
+_OLLAMA_MODELS_TTL = 60.0
+_OLLAMA_MODELS_CACHE: Dict[str, Any] = {"ts": 0.0, "models": None}
+_FALLBACK_OLLAMA_MODELS = [
+    "qwen3:8b", "qwen3:14b", "qwen2.5:7b", "qwen2.5:14b",
+    "llama3.1:8b", "llama3.1:70b", "phi3:3.8b", "mistral:7b"
+]
+
+def _list_ollama_models() -> list[str]:
+    """Installed Ollama models (blocking); updates the shared cache, [] if unavailable."""
+    models = []
+    try:
+        proc = subprocess.run(["ollama", "list"], capture_output=True, text=True, check=False, timeout=3)
+        for line in (proc.stdout or "").splitlines():
+            # typical format: name tag size modified
+            parts = line.strip().split()
+            if parts and parts[0] != "NAME":
+                models.append(parts[0])
+    except Exception:
+        pass
+    if models:
+        _OLLAMA_MODELS_CACHE.update(ts=time.monotonic(), models=models)
+    return models
+
+def _cached_ollama_models() -> list[str] | None:
+    models = _OLLAMA_MODELS_CACHE["models"]
+    if models and time.monotonic() - _OLLAMA_MODELS_CACHE["ts"] < _OLLAMA_MODELS_TTL:
+        return models
+    return None
+
+class OllamaModelsWorker(QObject):
+    finished = Signal(list)
+
+    def run(self):
+        self.finished.emit(_list_ollama_models())
+
+class _BackgroundJobs(QObject):
+    """Owns fire-and-forget worker threads (warmup, `ollama list`) instead of the widget that
+    started them, so closing a window or dialog never waits on them or destroys one mid-run.
+    Each thread is unparented and kept referenced until it has finished; main() waits for
+    any still running after the event loop ends (a model download is never cut off).
+    """
+    def __init__(self):
+        super().__init__()
+        self._jobs: dict[QThread, QObject] = {}
+
+    def start(self, worker: QObject) -> None:
+        """Run `worker.run()` on a new thread; `worker` must emit `finished` when done."""
+        thread = QThread()
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        # Direct: QThread.quit is thread-safe, and it must also work once the event loop is gone
+        worker.finished.connect(thread.quit, Qt.DirectConnection)
+        thread.finished.connect(self._release)  # queued to the GUI thread
+        self._jobs[thread] = worker
+        thread.start()
+
+    @Slot()
+    def _release(self):
+        thread = self.sender()
+        if thread in self._jobs:
+            thread.wait()  # returns at once: `finished` is the thread's last act
+            del self._jobs[thread]
+
+    def wait_all(self) -> None:
+        for thread in list(self._jobs):
+            thread.wait()
+        self._jobs.clear()
+
+_BACKGROUND_JOBS: _BackgroundJobs | None = None
+
+def _background_jobs() -> _BackgroundJobs:
+    global _BACKGROUND_JOBS
+    if _BACKGROUND_JOBS is None:
+        _BACKGROUND_JOBS = _BackgroundJobs()
+    return _BACKGROUND_JOBS
+
 class SettingsDialog(QDialog):
     def __init__(self, parent=None, current_ollama: str = "qwen3:8b", current_whisper: str = "medium"):
         super().__init__(parent)
@@ -580,13 +819,14 @@ class SettingsDialog(QDialog):
         whisper_header = QLabel("Whisper")
         whisper_header.setFont(header_font)
         layout.addWidget(whisper_header)
-        hint2 = QLabel("Medium has many more parameters. Transcriptions are much better, but STT can take longer.")
+        hint2 = QLabel("Medium has many more parameters. Transcriptions are much better, but STT can take longer. "
+                       "distil-small.en is the fastest option for English-only dictation.")
         hint2.setStyleSheet("color: #6b7280;")
         hint2.setWordWrap(True)
         layout.addWidget(hint2)
 
         self.cmb_whisper = QComboBox()
-        self.cmb_whisper.addItems(["base", "small", "medium"]) 
+        self.cmb_whisper.addItems(["base", "small", "medium", "distil-small.en"])
         # set default/current
         idx = max(0, self.cmb_whisper.findText(current_whisper))
         self.cmb_whisper.setCurrentIndex(idx if idx >= 0 else 2)
@@ -614,27 +854,24 @@ class SettingsDialog(QDialog):
         )
 
     def _populate_ollama_models(self, current: str):
-        models = []
-        # Try to call `ollama list` for real models
-        try:
-            proc = subprocess.run(["ollama", "list"], capture_output=True, text=True, check=False)
-            out = proc.stdout or ""
-            for line in out.splitlines():
-                # typical format: name tag size modified
-                parts = line.strip().split()
-                if parts:
-                    name = parts[0]
-                    if name != "NAME":
-                        models.append(name)
-        except Exception:
-            pass
-        # Fallback curated list
-        if not models:
-            models = [
-                "qwen3:8b", "qwen3:14b", "qwen2.5:7b", "qwen2.5:14b",
-                "llama3.1:8b", "llama3.1:70b", "phi3:3.8b", "mistral:7b"
-            ]
-        # Fill combobox
+        cached = _cached_ollama_models()
+        if cached:
+            self._fill_ollama_models(cached, current)
+            return
+        # Show the last known (or curated) list right away; `ollama list` runs in the background
+        self._fill_ollama_models(_OLLAMA_MODELS_CACHE["models"] or _FALLBACK_OLLAMA_MODELS, current)
+        # Owned by _background_jobs: closing the dialog must not wait for a slow or unreachable Ollama
+        worker = OllamaModelsWorker()
+        worker.finished.connect(self._on_ollama_models)
+        self._models_worker = worker
+        _background_jobs().start(worker)
+
+    def _on_ollama_models(self, models: list):
+        if models:
+            # Keep whatever the user has selected meanwhile
+            self._fill_ollama_models(models, self.cmb_ollama.currentText())
+
+    def _fill_ollama_models(self, models: list[str], current: str):
         self.cmb_ollama.clear()
         self.cmb_ollama.addItems(models)
         # Select current/default
@@ -643,6 +880,38 @@ class SettingsDialog(QDialog):
             idx = max(0, self.cmb_ollama.findText("qwen3:8b"))
         self.cmb_ollama.setCurrentIndex(idx if idx >= 0 else 0)
 
+    def done(self, result: int):
+        # Let a running `ollama list` finish on its own; just stop it from calling back
+        w = getattr(self, "_models_worker", None)
+        if w is not None:
+            try:
+                w.finished.disconnect(self._on_ollama_models)
+            except (RuntimeError, TypeError):
+                pass  # already disconnected
+            self._models_worker = None
+        super().done(result)
+
+_CIRCLE_CACHE: dict[tuple, QPixmap] = {}
+
+def _circle_pixmap(color: QColor, border: QColor, diameter: int, dpr: float) -> QPixmap:
+    """Antialiased filled circle, rasterized once per color/size/scale and shared."""
+    key = (color.rgba(), border.rgba(), diameter, dpr)
+    pm = _CIRCLE_CACHE.get(key)
+    if pm is None:
+        side = max(1, round(diameter * dpr))
+        pm = QPixmap(side, side)
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.Antialiasing, True)
+        p.setBrush(QBrush(color))
+        pen = QPen(border)
+        pen.setWidthF(0.5)
+        p.setPen(pen)
+        p.drawEllipse(0, 0, diameter - 1, diameter - 1)
+        p.end()
+        _CIRCLE_CACHE[key] = pm
+    return pm
 
 class CircleButton(QToolButton):
     """Small circular button painted manually to guarantee round traffic lights,
@@ -658,9 +927,15 @@ class CircleButton(QToolButton):
         self._diameter = int(diameter)
         self._active = True
         self._group_hover = False
+        # Fill color per (active, group_hover) state, resolved once
+        self._colors = {
+            (True, False): self._base,
+            (True, True): self._base.darker(110),  # ~10% darker
+            (False, False): self._inactive,
+            (False, True): self._inactive.darker(110),
+        }
         self.setFixedSize(self._diameter, self._diameter)
-        # Neutralize native styling
-        self.setStyleSheet("QToolButton{background: transparent; border: none; padding:0; margin:0;}")
+        # No per-widget stylesheet: paintEvent draws everything from cached pixmaps
         self.setCursor(Qt.ArrowCursor)
 
     def set_active(self, active: bool):
@@ -682,20 +957,122 @@ class CircleButton(QToolButton):
         return super().leaveEvent(event)
 
     def paintEvent(self, event):
+        color = self._colors[(self._active, self._group_hover)]
+        pm = _circle_pixmap(color, self._border, self._diameter, self.devicePixelRatioF())
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing, True)
-        rect = self.rect().adjusted(0, 0, -1, -1)
-        color = QColor(self._base if self._active else self._inactive)
-        if self._group_hover:
-            color = color.darker(110)  # ~10% darker
-        p.setBrush(QBrush(color))
-        pen = QPen(self._border)
-        pen.setWidth(0.5)
-        p.setPen(pen)
-        p.drawEllipse(rect)
+        p.drawPixmap(0, 0, pm)
         p.end()
 
+# Application stylesheet; main() installs it on the QApplication before any widget exists,
+# so it is parsed once and every widget is polished against it on creation. Type-only
+# rules are scoped under #rootContainer so they do not restyle dialogs, message boxes
+# or popups; ID rules already only match the main window's widgets.
+_STYLESHEET = """
+    QMainWindow { background: transparent; }
+    QWidget#rootContainer { background: #f0f0f0; border-radius: 10px; }
+
+    #topBar {
+        background: #ffffff;
+        border-bottom: 1px solid #e6e6e6;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+    }
+    /* Traffic light buttons drawn via CircleButton painter; no extra styling here */
+    QToolButton#menuBtn, QToolButton#settingsBtn { border: none; background: transparent; color: #6b7280; }
+    QToolButton#menuBtn:hover, QToolButton#settingsBtn:hover { background: #ececec; border-radius: 4px; color: #1f2937; }
+    #rootContainer QLabel { color: #1f2937; }
+    #rootContainer QScrollArea, #rootContainer QScrollArea > QWidget,
+    #rootContainer QScrollArea > QWidget > * { background: transparent; }
+    /* Opaque viewport (same color as rootContainer): Qt then skips repainting the root under it.
+       Scoped like the rule above so it outranks it */
+    #rootContainer QWidget#cardsViewport { background: #f0f0f0; }
+    #bottomBar {
+        border-top: 1px solid #eee;
+        background: #fff;
+        border-bottom-left-radius: 10px;
+        border-bottom-right-radius: 10px;
+    }
+    QLabel#cardTitle {
+        color: #1f2937;
+        font-weight: 600;
+        padding-top: 10px;
+    }
+    QWidget#card { background: #ffffff; border: 1px solid #e6e6e6; border-radius: 10px; }
+    #rootContainer QLineEdit, #rootContainer QPlainTextEdit, #rootContainer QTextEdit { background: #fff; border: 1px solid #e6e6e6; border-radius: 8px; padding: 8px 10px; font-size: 14px; color: #1f2937; }
+    #rootContainer QLineEdit[changed="true"], #rootContainer QPlainTextEdit[changed="true"],
+    #rootContainer QTextEdit[changed="true"] {
+        background: #FFF7ED; /* amber tint */
+        border-color: #f59e0b;
+    }
+
+    /* Minimal, modern scrollbars */
+    #rootContainer QScrollBar:vertical {
+        background: transparent;
+        width: 10px;
+        margin: 0px;
+    }
+    #rootContainer QScrollBar::handle:vertical {
+        background: #e0e0e0; /* match copy hover bg */
+        min-height: 24px;
+        border-radius: 8px;
+    }
+    #rootContainer QScrollBar::handle:vertical:hover {
+        background: #d9d9d9;
+    }
+    #rootContainer QScrollBar::add-line:vertical, #rootContainer QScrollBar::sub-line:vertical {
+        height: 0px; width: 0px; background: transparent; border: none;
+    }
+    #rootContainer QScrollBar:horizontal { height: 10px; background: transparent; }
+    #rootContainer QScrollBar::handle:horizontal { background: #ececec; min-width: 24px; border-radius: 8px; }
+    #rootContainer QScrollBar::handle:horizontal:hover { background: #e0e0e0; }
+    #rootContainer QScrollBar::add-page:vertical, #rootContainer QScrollBar::sub-page:vertical,
+    #rootContainer QScrollBar::add-page:horizontal, #rootContainer QScrollBar::sub-page:horizontal { background: transparent; }
+    QPushButton#copyBtn { padding: 4px; min-width: 32px; min-height: 32px; border-radius: 4px; border: none; background: transparent; color: #6b7280; }
+    QPushButton#copyBtn:hover { background: #d9d9d9; color: #1f2937; }
+    QPushButton#copyBtn:pressed { background: #cfcfcf; }
+    QPushButton#micBtn {
+        padding: 10px 16px;
+        border-radius: 12px;
+        background: #1f2937;
+        color: white;
+        border: none;
+    }
+    QPushButton#micBtn:hover { background: #2b3647; }
+    /* Exactly one of state="idle" | "recording" | "processing" */
+    QPushButton#micBtn[state="recording"] {
+        background: #e53935;
+    }
+    QPushButton#micBtn[state="recording"]:hover {
+        background: #e53935;
+    }
+    /* Processing state: orange with pulse animation handled in code */
+    QPushButton#micBtn[state="processing"],
+    QPushButton#micBtn:disabled[state="processing"] {
+        background: #f59e0b; /* orange */
+        color: white;
+    }
+    QPushButton#saveBtn {
+        padding: 10px 16px;
+        border-radius: 12px;
+        background: #f0f0f0;
+        color: #1f2937;
+        border: 1px solid #e6e6e6;
+    }
+    QPushButton#saveBtn:hover { background: #e7e7e7; }
+    QToolButton#newBtn { border: none; background: transparent; color: #6b7280; padding: 6px; border-radius: 8px; }
+    QToolButton#newBtn:hover { background: #ececec; color: #1f2937; }
+    #introOverlay {
+        background: transparent;
+        color: #c8c8c8; /* subtle vs #f0f0f0 background */
+        font-size: 22px;
+    }
+"""
+
+
 class MainWindow(QMainWindow):
+    # Queued into the persistent processing thread: (audio, samplerate, state snapshot)
+    _process_requested = Signal(object, int, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("MailWhisper")
@@ -705,10 +1082,37 @@ class MainWindow(QMainWindow):
         
         # State
         self.state: DraftState = initial_state()
+        # (text, visible) last pushed into each card; refresh_view skips unchanged fields
+        self._last_rendered: Dict[str, tuple[str, bool]] = {}
+        # Set when refresh_view ran while hidden/minimized; replayed once on show
+        self._view_dirty = False
+        # Streamed previews arrive per token; render at most the latest one per frame
+        self._pending_preview: str | None = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(16)
+        self._preview_timer.timeout.connect(self._flush_preview)
+        # Resize drags emit a burst of resize events; reposition overlays at most once per frame
+        self._reposition_timer = QTimer(self)
+        self._reposition_timer.setSingleShot(True)
+        self._reposition_timer.setInterval(16)
+        self._reposition_timer.timeout.connect(self._reposition_overlays)
         self.recorder = ButtonControlledRecorder(samplerate=16000, channels=1)
         self._recording = False
         self._processing = False
-        self._worker_thread: QThread | None = None
+        # Window drag state (frameless window, dragged by the top area)
+        self._drag_offset: QPoint | None = None
+        # Persistent processing thread + worker, reused for every recording
+        self._job_running = False
+        self._reset_after_job = False
+        self._proc_thread = QThread(self)
+        self._proc_worker = ProcessAudioWorker()
+        self._proc_worker.moveToThread(self._proc_thread)
+        self._process_requested.connect(self._proc_worker.process)
+        self._proc_worker.finished.connect(self.on_patch_ready)
+        self._proc_worker.partial.connect(self.on_partial_patch)
+        self._proc_worker.failed.connect(self.on_processing_failed)
+        self._proc_thread.start()
         # Intro dismissed flag must exist before any event filters run
         self._intro_dismissed = False
 
@@ -732,23 +1136,26 @@ class MainWindow(QMainWindow):
         top_bar.addWidget(traffic_wrap, alignment=Qt.AlignLeft)
         # Group-hover: when any light is hovered, all darken slightly
         self._traffic = [self.btn_close, self.btn_min, self.btn_max]
+        # Moving between lights emits leave+enter; settle on the final state before repainting
+        self._pending_hover = False
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(0)
+        self._hover_timer.timeout.connect(self._apply_traffic_hover)
         for b in self._traffic:
-            b.hoverChanged.connect(lambda s, self=self: self._set_traffic_hover(s))
+            b.hoverChanged.connect(self._set_traffic_hover)
 
         self.menu_btn = QToolButton()
         self.menu_btn.setObjectName("menuBtn")
         self.menu_btn.setFixedSize(40, 40)
-        self.menu_btn.setIcon(QIcon(resource_path("ui/icons/menu.svg")))
+        self.menu_btn.setIcon(_icon("ui/icons/menu.svg"))
         self.menu_btn.setIconSize(QSize(22, 22))
         self.menu_btn.setText("")
         top_bar.addWidget(self.menu_btn, alignment=Qt.AlignLeft)
         top_bar.addSpacing(16)
 
         self.logo_lbl = QLabel("🎙️✉️ MailWhisper")
-        font = QFont()
-        font.setPointSize(16)
-        font.setWeight(QFont.DemiBold)
-        self.logo_lbl.setFont(font)
+        self.logo_lbl.setFont(_logo_font())
         top_bar.addWidget(self.logo_lbl, alignment=Qt.AlignLeft)
 
         top_bar.addStretch(1)
@@ -756,7 +1163,7 @@ class MainWindow(QMainWindow):
         self.settings_btn = QToolButton()
         self.settings_btn.setObjectName("settingsBtn")
         self.settings_btn.setFixedSize(40, 40)
-        self.settings_btn.setIcon(QIcon(resource_path("ui/icons/settings.svg")))
+        self.settings_btn.setIcon(_icon("ui/icons/settings.svg"))
         self.settings_btn.setIconSize(QSize(22, 22))
         self.settings_btn.setText("")
         self.settings_btn.clicked.connect(self.show_settings)
@@ -772,16 +1179,20 @@ class MainWindow(QMainWindow):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setFrameShape(QFrame.NoFrame)
         content = QWidget()
+        self.cards_container = content
         self.center_layout = QVBoxLayout(content)
         self.center_layout.setContentsMargins(32, 24, 32, 24)
         self.center_layout.setSpacing(10)
 
+        # Custom tooltip instance, shared by the cards and the header buttons
+        self._soft_tip = SoftToolTip(self)
+
         # Cards for fields
-        self.card_to = FieldCard("To")
-        self.card_cc = FieldCard("Cc")
-        self.card_subject = FieldCard("Subject")
-        self.card_tone = FieldCard("Tone")
-        self.card_body = FieldCard("Body", multiline=True)
+        self.card_to = FieldCard("To", soft_tip=self._soft_tip)
+        self.card_cc = FieldCard("Cc", soft_tip=self._soft_tip)
+        self.card_subject = FieldCard("Subject", soft_tip=self._soft_tip)
+        self.card_tone = FieldCard("Tone", soft_tip=self._soft_tip)
+        self.card_body = FieldCard("Body", multiline=True, soft_tip=self._soft_tip)
 
         # copy actions handled inside each FieldCard (icon feedback + clipboard)
 
@@ -805,19 +1216,26 @@ class MainWindow(QMainWindow):
         # Use custom tooltip instead of native to avoid dark border
         self.new_btn.setToolTip("")
         self.new_btn.setFixedSize(40, 40)
-        self.new_btn.setIcon(QIcon(resource_path("ui/icons/badge-plus.svg")))
+        self.new_btn.setIcon(_icon("ui/icons/badge-plus.svg"))
         self.new_btn.setIconSize(QSize(20, 20))
         self.new_btn.clicked.connect(self.on_new_draft_clicked)
+        self._new_tip_timer = QTimer(self)
+        self._new_tip_timer.setSingleShot(True)
+        self._new_tip_timer.timeout.connect(lambda: self._show_soft_tip("New Draft"))
         self.new_btn.installEventFilter(self)
 
         self.mic_btn = QPushButton("🎤  Record")
         self.mic_btn.setObjectName("micBtn")
+        self.mic_btn.setProperty("state", "idle")
+        self.mic_btn.clicked.connect(self.dismiss_intro)  # no-op once dismissed
         self.mic_btn.clicked.connect(self.toggle_recording)
-        self.mic_btn.setFixedWidth(140)  # keep width stable across text changes
-        self._mic_btn_base_width = 140
-        # Processing overlay container (created on demand)
+        # Processing overlay container: built once, hidden, so the first stop has no hitch
         self._proc_container = None
         self._mic_spinner = None
+        self._proc_required_width = 0
+        self._build_proc_container()
+        # One width that fits every state; never changed later, so toggles don't relayout the bar
+        self.mic_btn.setFixedWidth(max(140, self._proc_required_width))
         self.mic_btn.installEventFilter(self)
 
         self.save_btn = QPushButton("💾  Save")
@@ -847,6 +1265,8 @@ class MainWindow(QMainWindow):
 
         # Frameless window look and interactions
         self.setWindowFlag(Qt.FramelessWindowHint, True)
+        # Translucent so #rootContainer's rounded corners are antialiased; a window mask is
+        # 1-bit and leaves jagged corners (worst on HiDPI)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.btn_close.clicked.connect(self.close)
         self.btn_min.clicked.connect(self.showMinimized)
@@ -857,11 +1277,15 @@ class MainWindow(QMainWindow):
         # Enable editing when idle by default
         self._update_editor_editable_state()
 
-        # Keyboard shortcut: Space toggles recording (start/stop)
-        self._space_shortcut = QShortcut(QKeySequence(Qt.Key_Space), self)
-        self._space_shortcut.setContext(Qt.ApplicationShortcut)
-        self._space_shortcut.setAutoRepeat(False)
-        self._space_shortcut.activated.connect(self._on_space_pressed)
+        # Space toggles recording (start/stop) via keyPressEvent. No button takes focus (bottom
+        # bar, card copy buttons, title bar), so a clicked button never turns Space into its own
+        # click. Editable editors type their own Space; read-only ones (while recording or
+        # processing) would scroll instead, so eventFilter routes their Space to the toggle.
+        for b in self.findChildren(QAbstractButton):
+            b.setFocusPolicy(Qt.NoFocus)
+        self._editors = tuple(
+            c.editor for c in (self.card_to, self.card_cc, self.card_subject, self.card_tone, self.card_body)
+        )
 
         # Intro overlay (subtle rotating messages until first interaction)
         self._intro_messages = [
@@ -872,12 +1296,15 @@ class MainWindow(QMainWindow):
             "You can refine later — start talking",
         ]
         self._setup_intro_overlay()
-        # Global event filter: observe button clicks; do not dismiss on outside focus changes
-        QApplication.instance().installEventFilter(self)
-        # Also watch the scroll viewport for resize so overlay stays perfectly centered
-        self.scroll_area.viewport().installEventFilter(self)
-        # Custom tooltip instance
-        self._soft_tip = SoftToolTip(self)
+        # Record-button clicks dismiss the intro via a direct connection; no app-wide
+        # filter, so other widgets' events never route through Python here.
+        # Watch the scroll viewport for resize so overlay stays perfectly centered
+        self._viewport = self.scroll_area.viewport()
+        self._viewport.setObjectName("cardsViewport")
+        self._viewport.installEventFilter(self)
+        # Editors last: eventFilter's Resize branch reads _viewport
+        for e in self._editors:
+            e.installEventFilter(self)
 
         # Toast area for transient messages (top-right)
         self._toast_area = QWidget(self)
@@ -886,116 +1313,22 @@ class MainWindow(QMainWindow):
         self._toast_layout = QVBoxLayout(self._toast_area)
         self._toast_layout.setContentsMargins(0, 0, 0, 0)
         self._toast_layout.setSpacing(8)
-        self._toasts: list[Toast] = []
+        # One toast at a time, so one pooled instance is reused for every message
+        self._toast = Toast("", parent=self._toast_area)
+        self._toast.hide()
+        self._toast_layout.addWidget(self._toast, 0, Qt.AlignRight | Qt.AlignTop)
         self._position_toast_area()
 
+        # Warm up STT + LLM off the UI thread; the mic button stays responsive. Owned by
+        # _background_jobs: a model download can outlast the window and is never cut off
+        _background_jobs().start(WarmupWorker())
+
     # Styling
     def apply_styles(self):
-        self.setStyleSheet("""
-            QMainWindow { background: transparent; }
-            QWidget#rootContainer { background: #f0f0f0; border-radius: 10px; }
-
-            #topBar {
-                background: #ffffff;
-                border-bottom: 1px solid #e6e6e6;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-            }
-            /* Traffic light buttons drawn via CircleButton painter; no extra styling here */
-            QToolButton#menuBtn, QToolButton#settingsBtn { border: none; background: transparent; color: #6b7280; }
-            QToolButton#menuBtn:hover, QToolButton#settingsBtn:hover { background: #ececec; border-radius: 4px; color: #1f2937; }
-            QLabel { color: #1f2937; }
-            QScrollArea, QScrollArea > QWidget, QScrollArea > QWidget > * { background: transparent; }
-            #bottomBar {
-                border-top: 1px solid #eee;
-                background: #fff;
-                border-bottom-left-radius: 10px;
-                border-bottom-right-radius: 10px;
-            }
-            QLabel#cardTitle {
-                color: #1f2937;
-                font-weight: 600;
-                padding-top: 10px;
-            }
-            QWidget#card { background: #ffffff; border: 1px solid #e6e6e6; border-radius: 10px; }
-            QLineEdit, QPlainTextEdit, QTextEdit { background: #fff; border: 1px solid #e6e6e6; border-radius: 8px; padding: 8px 10px; font-size: 14px; color: #1f2937; }
-            QLineEdit[changed="true"], QPlainTextEdit[changed="true"], QTextEdit[changed="true"] {
-                background: #FFF7ED; /* amber tint */
-                border-color: #f59e0b;
-            }
-            /* Body text styled like the input fields */
-            QLabel#bodyText {
-                background: #fff;
-                border: 1px solid #e6e6e6;
-                border-radius: 8px;
-                padding: 8px 10px; /* match QLineEdit padding (top/bottom 8, left/right 10) */
-                font-size: 14px;
-                color: #1f2937;
-            }
-
-            /* Minimal, modern scrollbars */
-            QScrollBar:vertical {
-                background: transparent;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #e0e0e0; /* match copy hover bg */
-                min-height: 24px;
-                border-radius: 8px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #d9d9d9;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px; width: 0px; background: transparent; border: none;
-            }
-            QScrollBar:horizontal { height: 10px; background: transparent; }
-            QScrollBar::handle:horizontal { background: #ececec; min-width: 24px; border-radius: 8px; }
-            QScrollBar::handle:horizontal:hover { background: #e0e0e0; }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical,
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal { background: transparent; }
-            QPushButton#copyBtn { padding: 4px; min-width: 32px; min-height: 32px; border-radius: 4px; border: none; background: transparent; color: #6b7280; }
-            QPushButton#copyBtn:hover { background: #d9d9d9; color: #1f2937; }
-            QPushButton#copyBtn:pressed { background: #cfcfcf; }
-            /* Global tooltip styling (clean, no harsh border) */
-            QToolTip { background: #ffffff; color: #1f2937; border: none; border-radius: 10px; padding: 0px 0px; }
-            QPushButton#micBtn {
-                padding: 10px 16px;
-                border-radius: 12px;
-                background: #1f2937;
-                color: white;
-                border: none;
-            }
-            QPushButton#micBtn:hover { background: #2b3647; }
-            QPushButton#micBtn[recording="true"] {
-                background: #e53935;
-            }
-            QPushButton#micBtn[recording="true"]:hover {
-                background: #e53935;
-            }
-            /* Processing state: orange with pulse animation handled in code */
-            QPushButton#micBtn[processing="true"],
-            QPushButton#micBtn:disabled[processing="true"] {
-                background: #f59e0b; /* orange */
-                color: white;
-            }
-            QPushButton#saveBtn {
-                padding: 10px 16px;
-                border-radius: 12px;
-                background: #f0f0f0;
-                color: #1f2937;
-                border: 1px solid #e6e6e6;
-            }
-            QPushButton#saveBtn:hover { background: #e7e7e7; }
-            QToolButton#newBtn { border: none; background: transparent; color: #6b7280; padding: 6px; border-radius: 8px; }
-            QToolButton#newBtn:hover { background: #ececec; color: #1f2937; }
-            QLabel#introOverlay {
-                background: transparent;
-                color: #c8c8c8; /* subtle vs #f0f0f0 background */
-                font-size: 22px;
-            }
-        """)
+        # Normally already installed by main(); only set it (re-polishing everything) if not
+        app = QApplication.instance()
+        if app.styleSheet() != _STYLESHEET:
+            app.setStyleSheet(_STYLESHEET)
 
     # Frameless window helpers
     def _toggle_max_restore(self):
@@ -1005,33 +1338,48 @@ class MainWindow(QMainWindow):
             self.showMaximized()
 
     def _set_traffic_hover(self, hovered: bool):
-        for b in getattr(self, '_traffic', []):
-            b.set_group_hover(hovered)
+        self._pending_hover = hovered
+        self._hover_timer.start()
+
+    def _apply_traffic_hover(self):
+        for b in self._traffic:
+            b.set_group_hover(self._pending_hover)
 
     def changeEvent(self, event):
         if event.type() == QEvent.ActivationChange:
             active = self.isActiveWindow()
             for b in getattr(self, '_traffic', []):
                 b.set_active(active)
+        elif event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._pause_intro()
+            else:
+                self._flush_dirty_view()
+                self._resume_intro()
         super().changeEvent(event)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._flush_dirty_view()
+        self._resume_intro()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._pause_intro()
+
     def mousePressEvent(self, event):
-        try:
-            posf = event.position()
-            pos = posf.toPoint()
-        except Exception:
-            pos = event.pos()
-        if event.button() == Qt.LeftButton and pos.y() <= 72:
-            self._drag_offset = event.globalPosition().toPoint() - self.frameGeometry().topLeft() if hasattr(event, 'globalPosition') else event.globalPos() - self.frameGeometry().topLeft()
+        # PySide6 (Qt 6) always provides position()/globalPosition()
+        if event.button() == Qt.LeftButton and event.position().y() <= 72:
+            self._drag_offset = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
             event.accept()
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        if getattr(self, '_drag_offset', None) is not None and (event.buttons() & Qt.LeftButton):
-            global_p = event.globalPosition().toPoint() if hasattr(event, 'globalPosition') else event.globalPos()
-            self.move(global_p - self._drag_offset)
-            event.accept()
-        super().mouseMoveEvent(event)
+        # Hot path while dragging: no attribute probing
+        if self._drag_offset is None or not (event.buttons() & Qt.LeftButton):
+            return super().mouseMoveEvent(event)
+        self.move(event.globalPosition().toPoint() - self._drag_offset)
+        event.accept()
 
     def mouseReleaseEvent(self, event):
         self._drag_offset = None
@@ -1041,7 +1389,7 @@ class MainWindow(QMainWindow):
     def show_settings(self):
         # Current selections come from module settings/env
         try:
-            curr_ollama = getattr(nodes_mod, 'GLOBAL_LLM_MODEL', 'qwen3:8b')
+            curr_ollama = getattr(_nodes_mod(), 'GLOBAL_LLM_MODEL', 'qwen3:8b')
         except Exception:
             curr_ollama = 'qwen3:8b'
         curr_whisper = os.getenv('WHISPER_LOCAL_MODEL', 'medium')
@@ -1051,7 +1399,7 @@ class MainWindow(QMainWindow):
             selected_whisper = dlg.cmb_whisper.currentText().strip()
             # Apply runtime settings
             try:
-                nodes_mod.set_llm_model(selected_ollama)
+                _nodes_mod().set_llm_model(selected_ollama)
             except Exception:
                 pass
             try:
@@ -1059,6 +1407,13 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Space and not event.isAutoRepeat():
+            self._on_space_pressed()
+            event.accept()
+            return
+        super().keyPressEvent(event)
+
     def _on_space_pressed(self):
         # Respect disabled state while processing
         if not self.mic_btn.isEnabled():
@@ -1072,18 +1427,19 @@ class MainWindow(QMainWindow):
             return
         # Overlay label is parented to the scroll area's viewport to stay centered
         vp = self.scroll_area.viewport()
-        self._intro_label = QLabel(vp)
+        self._intro_label = TypingLabel(vp)
         self._intro_label.setObjectName("introOverlay")
-        self._intro_label.setWordWrap(True)
-        self._intro_label.setAlignment(Qt.AlignCenter)
-        self._intro_label.setText("")
         self._intro_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         self._sync_intro_geometry()
         # Typing animation state and timers
         self._intro_index = 0
         self._typed_pos = 0
-        self._typing_timer = QTimer(self)
-        self._typing_timer.timeout.connect(self._advance_typing)
+        # One animation per message; Qt's animation timer drives it at frame rate
+        self._typing_anim = QVariantAnimation(self)
+        self._typing_anim.setStartValue(0)
+        self._typing_anim.setEasingCurve(QEasingCurve.Linear)
+        self._typing_anim.valueChanged.connect(self._advance_typing)
+        self._typing_anim.finished.connect(self._on_typing_done)
         self._hold_timer = QTimer(self)
         self._hold_timer.setSingleShot(True)
         self._hold_timer.timeout.connect(self._next_message)
@@ -1091,28 +1447,51 @@ class MainWindow(QMainWindow):
         # Kick off first typing cycle
         QTimer.singleShot(0, self._start_typing_cycle)
 
+    def _intro_can_run(self) -> bool:
+        # Only animate what can actually be seen: not dismissed, window shown and not minimized
+        return not self._intro_dismissed and self.isVisible() and not self.isMinimized()
+
+    def _pause_intro(self):
+        if hasattr(self, '_typing_anim'):
+            self._typing_anim.stop()
+            self._hold_timer.stop()
+
+    def _resume_intro(self):
+        if (hasattr(self, '_typing_anim') and self._intro_can_run()
+                and self._typing_anim.state() != QVariantAnimation.Running
+                and not self._hold_timer.isActive()):
+            self._start_typing_cycle()
+
     def _start_typing_cycle(self):
-        if self._intro_dismissed:
+        # Also reached from the hold timer; showEvent/restore resume a paused cycle
+        if not self._intro_can_run():
             return
         self._current_text = self._intro_messages[self._intro_index]
         self._typed_pos = 0
         self._intro_label.setText("")
-        # Compute per-char interval to finish around 0.5s, with a lower bound for readability
-        total_ms = 500
+        # Finish around 0.5s, with a lower bound of 18ms per char for readability
         n = max(1, len(self._current_text))
-        per_char = max(18, int(total_ms / n))
-        self._typing_timer.start(per_char)
+        self._typing_anim.stop()
+        self._typing_anim.setEndValue(n)
+        self._typing_anim.setDuration(max(500, 18 * n))
+        self._typing_anim.start()
+
+    def _advance_typing(self, value):
+        if self._intro_dismissed:
+            self._typing_anim.stop()
+            return
+        pos = int(value)
+        # Frames between two characters don't touch the label
+        if pos != self._typed_pos:
+            self._typed_pos = pos
+            self._intro_label.setText(self._current_text[:pos])
 
-    def _advance_typing(self):
+    def _on_typing_done(self):
         if self._intro_dismissed:
-            self._typing_timer.stop()
             return
-        self._typed_pos += 1
-        self._intro_label.setText(self._current_text[: self._typed_pos])
-        if self._typed_pos >= len(self._current_text):
-            # Done typing: hold for 3s, then next
-            self._typing_timer.stop()
-            self._hold_timer.start(3000)
+        self._intro_label.setText(self._current_text)
+        # Done typing: hold for 3s, then next
+        self._hold_timer.start(3000)
 
     def _next_message(self):
         if self._intro_dismissed:
@@ -1125,7 +1504,7 @@ class MainWindow(QMainWindow):
             return
         self._intro_dismissed = True
         try:
-            self._typing_timer.stop()
+            self._typing_anim.stop()
             self._hold_timer.stop()
         except Exception:
             pass
@@ -1135,6 +1514,9 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event):
         # Keep the overlay sized to the center area
         super().resizeEvent(event)
+        self._reposition_timer.start()
+
+    def _reposition_overlays(self):
         self._sync_intro_geometry()
         self._position_toast_area()
 
@@ -1155,30 +1537,29 @@ class MainWindow(QMainWindow):
             pass
 
     def eventFilter(self, obj, event):
-        # Dismiss only when the Record button is clicked (not other buttons)
-        if (not getattr(self, '_intro_dismissed', True)
-            and event.type() == QEvent.MouseButtonPress
-            and obj is getattr(self, 'mic_btn', None)):
-            self.dismiss_intro()
-        # Keep overlay centered when the scroll viewport resizes
-        if obj is self.scroll_area.viewport() and event.type() == QEvent.Resize:
-            self._sync_intro_geometry()
-        # Custom tooltip handling for New Draft button
-        if obj is getattr(self, 'new_btn', None):
-            if event.type() == QEvent.Enter:
-                # Show after a short delay to mimic native behavior
-                if not hasattr(self, '_new_tip_timer'):
-                    self._new_tip_timer = QTimer(self)
-                    self._new_tip_timer.setSingleShot(True)
-                    self._new_tip_timer.timeout.connect(lambda: self._show_soft_tip("New Draft"))
+        # Only new_btn, mic_btn, the scroll viewport and the card editors are filtered; all exist
+        # before their filter is installed, so no getattr fallbacks on this per-event path
+        et = event.type()  # read once; each PySide enum access is a Python-level call
+        if obj is self.new_btn:
+            # Custom tooltip for New Draft: show after a short delay to mimic native behavior
+            if et == _EV_ENTER:
                 self._new_tip_timer.start(600)
-            elif event.type() in (QEvent.Leave, QEvent.MouseButtonPress):
-                if hasattr(self, '_new_tip_timer'):
-                    self._new_tip_timer.stop()
+            elif et == _EV_LEAVE or et == _EV_PRESS:
+                self._new_tip_timer.stop()
                 self._soft_tip.hide()
-        # Button resize: layout will keep overlay centered; ensure size hint is updated
-        if obj is getattr(self, 'mic_btn', None) and event.type() == QEvent.Resize:
-            self._center_proc_container()
+        elif et == _EV_RESIZE:
+            if obj is self.mic_btn:
+                # Button resize: layout will keep overlay centered; ensure size hint is updated
+                self._center_proc_container()
+            elif obj is self._viewport:
+                # Keep overlay centered when the scroll viewport resizes
+                self._reposition_timer.start()
+        elif et == _EV_KEY_PRESS:
+            # Read-only editor (recording/processing): Space is the record toggle, not page-down
+            if event.key() == Qt.Key_Space and obj in self._editors and obj.isReadOnly():
+                if not event.isAutoRepeat():
+                    self._on_space_pressed()
+                return True
         return super().eventFilter(obj, event)
 
     def _show_soft_tip(self, text: str):
@@ -1193,48 +1574,11 @@ class MainWindow(QMainWindow):
     # ---- Toast helpers ----
     def show_toast(self, text: str, kind: str = "info", duration_ms: int = 3000):
         try:
-            # Only one toast at a time: clear any existing
-            for t in list(self._toasts):
-                try:
-                    t.hide()
-                    t.deleteLater()
-                except Exception:
-                    pass
-            self._toasts.clear()
-            # Remove any leftover layout items
-            try:
-                while self._toast_layout.count():
-                    item = self._toast_layout.takeAt(0)
-                    w = item.widget()
-                    if w is not None:
-                        w.deleteLater()
-            except Exception:
-                pass
-
-            t = Toast(text, kind=kind, duration_ms=duration_ms, parent=self._toast_area)
-            t.closed.connect(self._remove_toast)
-            self._toast_layout.addWidget(t, 0, Qt.AlignRight | Qt.AlignTop)
-            self._toasts.append(t)
-            t.show_with_fade()
+            self._toast.show_message(text, kind=kind, duration_ms=duration_ms)
         except Exception:
             pass
 
-    def _remove_toast(self, toast: Toast):
-        try:
-            if toast in self._toasts:
-                self._toasts.remove(toast)
-            # Also remove from layout to avoid stacking gaps
-            for i in reversed(range(self._toast_layout.count())):
-                item = self._toast_layout.itemAt(i)
-                if item and item.widget() is toast:
-                    self._toast_layout.takeAt(i)
-                    break
-        except Exception:
-            pass
-
-    def _ensure_proc_container(self):
-        if self._proc_container is not None:
-            return
+    def _build_proc_container(self):
         try:
             # Container with spinner + label
             cont = QWidget(self.mic_btn)
@@ -1247,6 +1591,7 @@ class MainWindow(QMainWindow):
             lay.addWidget(sp)
             lay.addWidget(lbl)
             cont.adjustSize()
+            cont.hide()
 
             # Put the container centered inside the button using a layout on the button itself
             if not hasattr(self, "_mic_btn_layout") or self._mic_btn_layout is None:
@@ -1258,6 +1603,7 @@ class MainWindow(QMainWindow):
 
             self._proc_container = cont
             self._mic_spinner = sp
+            self._proc_required_width = cont.sizeHint().width() + 20  # small side padding
         except Exception:
             self._proc_container = None
             self._mic_spinner = None
@@ -1279,42 +1625,31 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self._recording = True
-            self.mic_btn.setText("⏹  Stop")
-            self.mic_btn.setProperty("recording", True)
-            self.mic_btn.style().unpolish(self.mic_btn)
-            self.mic_btn.style().polish(self.mic_btn)
+            self._set_mic_state(text="⏹  Stop", state="recording")
             # Disable editing while recording
             self._update_editor_editable_state()
             # Avoid resetting while recording
-            if hasattr(self, 'new_btn'):
-                self.new_btn.setEnabled(False)
+            self.new_btn.setEnabled(False)
             try:
                 self.recorder.start()
+                # Warm the LLM (model load + system prompt prefill) while the user speaks
+                _nodes_mod().prefill_llm_async()
             except Exception as e:
                 self._recording = False
-                self.mic_btn.setText("🎤  Record")
-                self.mic_btn.setProperty("recording", False)
-                self.mic_btn.style().unpolish(self.mic_btn)
-                self.mic_btn.style().polish(self.mic_btn)
+                self._set_mic_state(text="🎤  Record", state="idle")
                 # Re-enable editing since start failed
                 try:
                     self._update_editor_editable_state()
                 except Exception:
                     pass
-                print(f"Audio error: {e}", file=sys.stderr)
-                if hasattr(self, 'new_btn'):
-                    self.new_btn.setEnabled(True)
+                log.error("Audio error: %s", e)
+                self.new_btn.setEnabled(True)
                 self.show_toast("Audio error — see console for details", kind="error")
         else:
             # Stop and process
             self._recording = False
-            self.mic_btn.setText("🎤  Record")
-            self.mic_btn.setProperty("recording", False)
-            self.mic_btn.style().unpolish(self.mic_btn)
-            self.mic_btn.style().polish(self.mic_btn)
-            # Still disabled while processing will be true
-            self._update_editor_editable_state()
-            # Stop the audio stream in a background thread to avoid UI hangs on macOS CoreAudio
+            # Stop the audio stream in a background thread to avoid UI hangs on macOS CoreAudio;
+            # the processing visuals also clear the recording state (one restyle)
             self._set_mic_processing(True)
             self._stop_thread = QThread(self)
             self._stop_worker = StopAudioWorker(self.recorder)
@@ -1337,30 +1672,24 @@ class MainWindow(QMainWindow):
                 self._stop_worker = None
             self._stop_thread.finished.connect(_cleanup_stop)
             # Prevent starting a new draft during stopping
-            if hasattr(self, 'new_btn'):
-                self.new_btn.setEnabled(False)
+            self.new_btn.setEnabled(False)
             self._stop_thread.start()
 
     def run_processing_worker(self, audio: np.ndarray):
         # Button enters processing state and becomes disabled
         self._set_mic_processing(True)
-        self._worker_thread = QThread(self)
-        # Keep a strong reference so Python GC doesn't collect the worker
-        self._worker = ProcessAudioWorker(audio, 16000, self.state)
-        self._worker.moveToThread(self._worker_thread)
-        self._worker_thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self.on_patch_ready)
-        self._worker.failed.connect(self.on_processing_failed)
-        # Cleanup
-        self._worker.finished.connect(self._worker_thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._worker.failed.connect(self._worker_thread.quit)
-        self._worker.failed.connect(self._worker.deleteLater)
-        self._worker_thread.finished.connect(self._on_thread_finished)
         # Prevent starting a fresh draft during processing
-        if hasattr(self, 'new_btn'):
-            self.new_btn.setEnabled(False)
-        self._worker_thread.start()
+        self.new_btn.setEnabled(False)
+        # Hand the job to the persistent worker thread (queued connection)
+        self._job_running = True
+        self._proc_worker.reset()
+        # Snapshot the draft now: the worker reads it seconds later, after transcription,
+        # and must not see edits (or a Save) made in the meantime
+        snap = {k: self.state[k] for k in _NODE_KEYS if k in self.state}
+        for k in ("to", "cc"):
+            if isinstance(snap.get(k), list):
+                snap[k] = list(snap[k])
+        self._process_requested.emit(audio, 16000, snap)
 
     def _on_audio_stopped(self, audio: object):
         try:
@@ -1370,20 +1699,32 @@ class MainWindow(QMainWindow):
         if arr.size == 0:
             self._set_mic_processing(False)
             self.show_toast("No audio recorded.", kind="warning")
-            if hasattr(self, 'new_btn'):
-                self.new_btn.setEnabled(True)
+            self.new_btn.setEnabled(True)
             return
         # Chain into processing worker
         self.run_processing_worker(arr)
 
     def _on_stop_failed(self, msg: str):
-        print(f"Audio stop error: {msg}", file=sys.stderr)
+        log.error("Audio stop error: %s", msg)
         self._set_mic_processing(False)
-        if hasattr(self, 'new_btn'):
-            self.new_btn.setEnabled(True)
+        self.new_btn.setEnabled(True)
         self.show_toast("Audio stop error", kind="error")
 
+    def _finish_job(self) -> bool:
+        """Mark the running job done; returns True if a pending reset consumed it."""
+        self._job_running = False
+        # A preview still queued must not land on top of the final result
+        self._preview_timer.stop()
+        self._pending_preview = None
+        if self._reset_after_job:
+            self._reset_after_job = False
+            self._reset_to_new_draft()
+            return True
+        return False
+
     def on_patch_ready(self, patch: Dict[str, Any]):
+        if self._finish_job():
+            return
         # Diff old vs. new to highlight changed fields
         old = dict(self.state)
         self.state.update(patch or {})
@@ -1411,19 +1752,40 @@ class MainWindow(QMainWindow):
         self._set_mic_processing(False)
         # Re-enable editing when idle
         self._update_editor_editable_state()
-        if hasattr(self, 'new_btn'):
-            self.new_btn.setEnabled(True)
+        self.new_btn.setEnabled(True)
         # Notify if nothing came back (e.g., cancelled)
         if not patch:
             self.show_toast("Cancelled", kind="info", duration_ms=1800)
 
+    def on_partial_patch(self, patch: Dict[str, Any]):
+        # Preview only; self.state is updated once the final patch arrives
+        patch = patch or {}
+        text = patch.get("body")
+        if not text:
+            # Live transcript: only previewed on an empty draft, never over existing text
+            text = patch.get("transcript")
+            if not text or _has_text(self.state.get("body") or ""):
+                return
+        self._pending_preview = text
+        # Not restarted while armed, so a steady stream still renders every ~16 ms
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
+
+    def _flush_preview(self):
+        text, self._pending_preview = self._pending_preview, None
+        if text:
+            self._render_card("body", self.card_body, text, True)
+
     def on_processing_failed(self, msg: str):
-        print(f"Processing failed: {msg}", file=sys.stderr)
+        log.error("Processing failed: %s", msg)
+        if self._finish_job():
+            return
+        # Drop any streamed preview that never made it into the state
+        self.refresh_view()
         self._set_mic_processing(False)
         # Re-enable editing when idle
         self._update_editor_editable_state()
-        if hasattr(self, 'new_btn'):
-            self.new_btn.setEnabled(True)
+        self.new_btn.setEnabled(True)
         self.show_toast(f"Processing failed: {msg}", kind="error")
 
     def _flash_changed(self, fields: list[str], duration_ms: int = 1000):
@@ -1455,56 +1817,38 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _on_thread_finished(self):
-        # Drop references so GC can clean up
-        try:
-            self._worker_thread.deleteLater()
-        except Exception:
-            pass
-        self._worker_thread = None
-        self._worker = None
+    def _set_mic_state(self, *, text: str | None = None, enabled: bool | None = None, state: str | None = None):
+        """Update the mic button; re-resolve its QSS only when the `state` property changes."""
+        b = self.mic_btn
+        if enabled is not None:
+            b.setEnabled(enabled)
+        if text is not None:
+            b.setText(text)
+        if state is not None and b.property("state") != state:
+            b.setProperty("state", state)
+            # QStyleSheetStyle.polish drops the widget's cached rules itself; no unpolish pass
+            b.style().polish(b)
+            b.update()
 
     def _set_mic_processing(self, on: bool):
         if on:
             self._processing = True
-            self.mic_btn.setEnabled(False)
             # Text moved into overlay for perfect centering
-            self.mic_btn.setText("")
-            self.mic_btn.setProperty("processing", True)
-            self.mic_btn.style().unpolish(self.mic_btn)
-            self.mic_btn.style().polish(self.mic_btn)
-            self._ensure_proc_container()
-            self._center_proc_container()
+            self._set_mic_state(text="", enabled=False, state="processing")
+            # Save would commit the streaming preview into state mid-job
+            self.save_btn.setEnabled(False)
             if self._mic_spinner:
                 self._mic_spinner.start()
             if self._proc_container:
                 self._proc_container.show()
-                # Ensure button is wide enough for spinner + label
-                try:
-                    self._proc_container.adjustSize()
-                    required = self._proc_container.width() + 20  # small side padding
-                    if required > self.mic_btn.width():
-                        self.mic_btn.setFixedWidth(required)
-                        self._center_proc_container()
-                except Exception:
-                    pass
         else:
             self._processing = False
             if self._mic_spinner:
                 self._mic_spinner.stop()
             if self._proc_container:
                 self._proc_container.hide()
-            self.mic_btn.setEnabled(True)
-            self.mic_btn.setText("🎤  Record")
-            self.mic_btn.setProperty("processing", False)
-            self.mic_btn.style().unpolish(self.mic_btn)
-            self.mic_btn.style().polish(self.mic_btn)
-            # Restore baseline width to keep layout consistent
-            try:
-                if getattr(self, '_mic_btn_base_width', None):
-                    self.mic_btn.setFixedWidth(self._mic_btn_base_width)
-            except Exception:
-                pass
+            self._set_mic_state(text="🎤  Record", enabled=True, state="idle")
+            self.save_btn.setEnabled(True)
         # Keep editors disabled while recording/processing, else enable
         try:
             self._update_editor_editable_state()
@@ -1519,30 +1863,20 @@ class MainWindow(QMainWindow):
             pass
         # Placeholder: implement later (export, sending, etc.)
         self.state["done"] = True
-        print("Save clicked — state marked as done.")
+        log.info("Save clicked — state marked as done.")
         self.show_toast("Saved", kind="success")
 
     def on_new_draft_clicked(self):
         """Reset the UI to a fresh DraftState and restore recording UI."""
         # If processing is running, cancel and perform reset once finished
-        if getattr(self, "_worker_thread", None) is not None and self._worker_thread.isRunning():
-            try:
-                if getattr(self, "_worker", None) is not None:
-                    # Ask worker to cancel further work
-                    try:
-                        self._worker.cancel()
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        if self._job_running:
+            # Ask worker to cancel further work
+            self._proc_worker.cancel()
             # Disable actions while waiting
             self.mic_btn.setEnabled(False)
-            if hasattr(self, 'new_btn'):
-                self.new_btn.setEnabled(False)
-            # Once the worker thread finishes, complete reset
-            def _after():
-                self._reset_to_new_draft()
-            self._worker_thread.finished.connect(_after)
+            self.new_btn.setEnabled(False)
+            # Once the running job reports back, complete reset
+            self._reset_after_job = True
             return
 
         # If currently recording, stop stream and discard frames
@@ -1561,13 +1895,10 @@ class MainWindow(QMainWindow):
     def _reset_to_new_draft(self):
         # Ensure we are not in processing/recording visuals
         self._set_mic_processing(False)
-        self.mic_btn.setProperty("recording", False)
-        self.mic_btn.style().unpolish(self.mic_btn)
-        self.mic_btn.style().polish(self.mic_btn)
-        if hasattr(self, 'new_btn'):
-            self.new_btn.setEnabled(True)
-        # Reset application state and UI
+        self.new_btn.setEnabled(True)
+        # Reset application state and UI (editors may hold manual edits)
         self.state = initial_state()
+        self._last_rendered.clear()
         self.refresh_view()
         # After reset, allow editing (idle)
         self._update_editor_editable_state()
@@ -1597,6 +1928,9 @@ class MainWindow(QMainWindow):
 
     def _commit_editor_state_to_state(self):
         """Read current editor values and store them in self.state for the graph."""
+        # Editors must show the current state before they are read back into it
+        if self._view_dirty:
+            self._apply_view()
         # to/cc: split by commas/semicolons/whitespace, remove empties
         def parse_recipients(text: str) -> list[str]:
             if not isinstance(text, str):
@@ -1625,6 +1959,8 @@ class MainWindow(QMainWindow):
         self.state['subject'] = subject
         self.state['tone'] = tone
         self.state['body'] = body
+        # Editors may now differ from what was last rendered; force a full re-render
+        self._last_rendered.clear()
 
     # Intro control
     def restart_intro(self):
@@ -1634,8 +1970,8 @@ class MainWindow(QMainWindow):
             if hasattr(self, '_intro_label') and self._intro_label is not None:
                 self._intro_label.show()
                 # Reset typing cycle
-                if hasattr(self, '_typing_timer') and self._typing_timer is not None:
-                    self._typing_timer.stop()
+                if hasattr(self, '_typing_anim') and self._typing_anim is not None:
+                    self._typing_anim.stop()
                 if hasattr(self, '_hold_timer') and self._hold_timer is not None:
                     self._hold_timer.stop()
                 self._intro_index = 0
@@ -1650,30 +1986,26 @@ class MainWindow(QMainWindow):
     # Graceful shutdown on app close
     def closeEvent(self, event):
         try:
-            # Cancel running worker if any
-            if getattr(self, "_worker_thread", None) is not None and self._worker_thread.isRunning():
+            # Cancel running job if any, then stop the persistent worker thread
+            if self._proc_thread.isRunning():
                 try:
-                    if getattr(self, "_worker", None) is not None:
-                        try:
-                            self._worker.cancel()
-                        except Exception:
-                            pass
+                    self._proc_worker.cancel()
                 except Exception:
                     pass
                 try:
-                    self._worker_thread.quit()
+                    self._proc_thread.quit()
                 except Exception:
                     pass
                 # Wait briefly for clean exit
                 try:
-                    self._worker_thread.wait(3000)
+                    self._proc_thread.wait(3000)
                 except Exception:
                     pass
                 # Fallback: forcefully terminate if still alive (last resort)
                 try:
-                    if self._worker_thread.isRunning():
-                        self._worker_thread.terminate()
-                        self._worker_thread.wait(1000)
+                    if self._proc_thread.isRunning():
+                        self._proc_thread.terminate()
+                        self._proc_thread.wait(1000)
                 except Exception:
                     pass
         finally:
@@ -1683,7 +2015,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             # Stop app-level timers to avoid late events on shutdown
-            for name in ("_typing_timer", "_hold_timer", "_new_tip_timer"):
+            for name in ("_typing_anim", "_hold_timer", "_new_tip_timer"):
                 try:
                     t = getattr(self, name, None)
                     if t:
@@ -1693,62 +2025,105 @@ class MainWindow(QMainWindow):
         super().closeEvent(event)
 
     # View Binding
+    def _render_card(self, key: str, card: FieldCard, text: str, visible: bool):
+        # Only touch the widget (and re-run its text layout) on an actual change
+        last_text, last_visible = self._last_rendered.get(key, (None, None))
+        if last_text != text:
+            if last_text and card is self.card_body and text.startswith(last_text):
+                # Streaming growth: lay out only the new tail, not the whole body
+                card.append_text(text[len(last_text):])
+            else:
+                card.set_text(text)
+        if last_visible != visible:
+            card.setVisible(visible)
+        self._last_rendered[key] = (text, visible)
+
     def refresh_view(self):
-        # to
-        tos = self.state.get("to", []) or []
-        to_text = ", ".join(tos)
-        self.card_to.set_text(to_text)
-        self.card_to.setVisible(bool(to_text))
-
-        # cc
-        ccs = self.state.get("cc", []) or []
-        cc_text = ", ".join(ccs)
-        self.card_cc.set_text(cc_text)
-        self.card_cc.setVisible(bool(cc_text))
-
-        # subject
-        subject = self.state.get("subject", "") or ""
-        self.card_subject.set_text(subject)
-        self.card_subject.setVisible(bool(subject.strip()))
-
-        # tone
-        tone = (self.state.get("tone") or "").strip()
-        # Minimalist: hide tone when neutral
-        if tone and tone != "neutral":
-            self.card_tone.set_text(tone)
-            self.card_tone.setVisible(True)
-        else:
-            self.card_tone.set_text(tone or "neutral")
-            self.card_tone.setVisible(False)
+        # Nothing on screen to update: remember it and refresh once when shown again
+        if not self.isVisible() or self.isMinimized():
+            self._view_dirty = True
+            return
+        self._apply_view()
+
+    def _apply_view(self):
+        self._view_dirty = False
+        # Suppress repaints while the cards change, so they repaint once together
+        self.cards_container.setUpdatesEnabled(False)
+        try:
+            self._refresh_cards()
+        finally:
+            # Re-enabling schedules a single update of the container
+            self.cards_container.setUpdatesEnabled(True)
+
+    def _flush_dirty_view(self):
+        if self._view_dirty and self.isVisible() and not self.isMinimized():
+            self.refresh_view()
+
+    def _refresh_cards(self):
+        get = self.state.get
+        to_text = ", ".join(get("to") or [])
+        cc_text = ", ".join(get("cc") or [])
+        subject = get("subject") or ""
+        tone = (get("tone") or "").strip()
+        body = get("body") or ""
+        for key, card, text, visible in (
+            ("to", self.card_to, to_text, bool(to_text)),
+            ("cc", self.card_cc, cc_text, bool(cc_text)),
+            ("subject", self.card_subject, subject, _has_text(subject)),
+            # Minimalist: hide tone when neutral
+            ("tone", self.card_tone, tone or "neutral", bool(tone) and tone != "neutral"),
+            ("body", self.card_body, body, _has_text(body)),
+        ):
+            self._render_card(key, card, text, visible)
+
+
+def _has_text(s: str) -> bool:
+    """Non-blank check without building a stripped copy of (possibly long) text."""
+    return bool(s) and not s.isspace()
+
+# Light palette applied in main(); tooltips use it too (avoids dark outlines)
+_LIGHT_PALETTE = (
+    (QPalette.Window, 0xf0f0f0),
+    (QPalette.Base, 0xffffff),
+    (QPalette.AlternateBase, 0xf0f0f0),
+    (QPalette.Button, 0xffffff),
+    (QPalette.Text, 0x1f2937),
+    (QPalette.WindowText, 0x1f2937),
+    (QPalette.ButtonText, 0x1f2937),
+    (QPalette.ToolTipBase, 0xffffff),
+    (QPalette.ToolTipText, 0x1f2937),
+)
 
-        # body
-        body = self.state.get("body", "") or ""
-        self.card_body.set_text(body)
-        self.card_body.setVisible(bool(body.strip()))
+_APP_PALETTE: QPalette | None = None
 
+def _app_palette() -> QPalette:
+    """Built once per process (needs a QApplication); later windows can share it."""
+    global _APP_PALETTE
+    if _APP_PALETTE is None:
+        _APP_PALETTE = QPalette()
+        for role, rgb in _LIGHT_PALETTE:
+            _APP_PALETTE.setColor(role, QColor.fromRgb(rgb))
+    return _APP_PALETTE
 
 def main():
+    _setup_logging()
+    # Overlap heavy imports with Qt/window construction
+    threading.Thread(target=_preload_heavy_modules, name="preload", daemon=True).start()
+    # Merge bursts of mouse-move/tablet events into one per frame (explicit; platform defaults differ)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
     app = QApplication(sys.argv)
     # Force a light theme regardless of OS dark mode
-    QApplication.setStyle("Fusion")
-    pal = QPalette()
-    pal.setColor(QPalette.Window, QColor("#f0f0f0"))
-    pal.setColor(QPalette.Base, QColor("#ffffff"))
-    pal.setColor(QPalette.AlternateBase, QColor("#f0f0f0"))
-    pal.setColor(QPalette.Button, QColor("#ffffff"))
-    pal.setColor(QPalette.Text, QColor("#1f2937"))
-    pal.setColor(QPalette.WindowText, QColor("#1f2937"))
-    pal.setColor(QPalette.ButtonText, QColor("#1f2937"))
-    # Ensure tooltips use the same clean palette (avoid dark outlines)
-    try:
-        pal.setColor(QPalette.ToolTipBase, QColor("#ffffff"))
-        pal.setColor(QPalette.ToolTipText, QColor("#1f2937"))
-    except Exception:
-        pass
-    app.setPalette(pal)
+    if app.style().name().lower() != "fusion":
+        QApplication.setStyle("Fusion")
+    app.setPalette(_app_palette())
+    app.setStyleSheet(_STYLESHEET)
     win = MainWindow()
     win.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    # Window is gone; let a warmup/model-list thread still loading finish before teardown
+    _background_jobs().wait_all()
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,33 +1,61 @@
-import sys, threading, queue
-from typing import Optional, List
+import logging
+from typing import Optional
 import numpy as np
 import sounddevice as sd
+from utils.mic_mem import INPUT_BLOCKSIZE, input_latency
+
+_log = logging.getLogger("mailwhisper.recorder")
+
+# Initial capacity of the capture buffer; grows by doubling for longer recordings
+_INITIAL_SECONDS = 60
 
 class ButtonControlledRecorder:
     def __init__(self, samplerate: int = 16000, channels: int = 1):
         self.samplerate = samplerate
         self.channels = channels
-        self._q: "queue.Queue[np.ndarray]" = queue.Queue()
-        self._chunks: List[np.ndarray] = []
+        # Frames are written straight from the audio callback into one contiguous
+        # int16 buffer; stop() hands out a view of it without concatenating.
+        # 16-bit PCM is what the mic delivers: half the bytes of float32 per block,
+        # converted to float32 once, right before Whisper (see prepare_audio in utils.stt_whisper_mem).
+        self._buf = np.empty((0, channels), dtype=np.int16)
+        self._pos = 0
+        # Set by the audio callback, logged from stop() (never from the PortAudio thread)
+        self._status_count = 0
+        self._last_status: Optional[sd.CallbackFlags] = None
         self._stream: Optional[sd.InputStream] = None
         self._running = False
 
     def _audio_cb(self, indata, frames, time, status):
         if status:
-            print(f"Audio status: {status}", file=sys.stderr)
-        self._q.put(indata.copy())
+            # Runs on the PortAudio thread: no logging/I/O here, just note it for stop()
+            self._status_count += 1
+            self._last_status = status
+        end = self._pos + frames
+        if end > len(self._buf):
+            grown = np.empty((max(end, 2 * len(self._buf)), self.channels), dtype=np.int16)
+            grown[: self._pos] = self._buf[: self._pos]
+            self._buf = grown
+        self._buf[self._pos:end] = indata
+        self._pos = end
 
     def start(self):
         if self._running:
             return
         self._running = True
-        self._chunks.clear()
+        # Fresh buffer per recording: the previous one may still be read by the worker.
+        # np.empty only reserves memory; pages are touched as audio arrives.
+        self._buf = np.empty((_INITIAL_SECONDS * self.samplerate, self.channels), dtype=np.int16)
+        self._pos = 0
+        self._status_count = 0
+        self._last_status = None
         try:
             self._stream = sd.InputStream(
                 samplerate=self.samplerate,
                 channels=self.channels,
                 callback=self._audio_cb,
-                dtype="float32",
+                dtype="int16",
+                blocksize=INPUT_BLOCKSIZE,
+                latency=input_latency(),
             )
             self._stream.start()
         except Exception:
@@ -40,40 +68,26 @@ class ButtonControlledRecorder:
             finally:
                 self._stream = None
             raise
-        # Background thread collects frames
-        def pump():
-            while self._running:
-                try:
-                    self._chunks.append(self._q.get(timeout=0.1))
-                except queue.Empty:
-                    pass
-        self._pump_thread = threading.Thread(target=pump, daemon=True)
-        self._pump_thread.start()
 
     def stop(self) -> np.ndarray:
         if not self._running:
-            return np.zeros((0, self.channels), dtype=np.float32)
+            return np.zeros((0, self.channels), dtype=np.int16)
         self._running = False
         try:
             if self._stream:
+                # stop() waits for pending callbacks, so _buf/_pos are final afterwards
                 self._stream.stop()
                 self._stream.close()
         finally:
             self._stream = None
-        # Ensure background pump thread terminates cleanly
-        try:
-            t = getattr(self, "_pump_thread", None)
-            if t is not None and t.is_alive():
-                t.join(timeout=0.5)
-        except Exception:
-            pass
-        self._pump_thread = None
-        if not self._chunks:
+        if self._status_count:
+            _log.warning("Audio status: %s (%d callback(s) flagged)", self._last_status, self._status_count)
+        if self._pos == 0:
             raise RuntimeError("No audio recorded.")
-        return np.concatenate(self._chunks, axis=0)
+        return self._buf[: self._pos]
 
     def shutdown(self):
-        """Forcefully stop and release all audio resources and join threads.
+        """Forcefully stop and close the input stream (no threads of our own to join).
         Safe to call multiple times and from close handlers.
         """
         try:
@@ -84,10 +98,5 @@ class ButtonControlledRecorder:
                     self._stream.close()
             finally:
                 self._stream = None
-            t = getattr(self, "_pump_thread", None)
-            if t is not None and t.is_alive():
-                t.join(timeout=0.5)
         except Exception:
-            pass
-        finally:
-            self._pump_thread = None
\ No newline at end of file
+            pass
\ No newline at end of file
@@ -1,35 +1,62 @@
-import sys, threading, queue
+import os, sys, threading
 import numpy as np
 import sounddevice as sd
 
+# Initial capacity of the capture buffer; grows by doubling for longer recordings
+_INITIAL_SECONDS = 60
+# Fixed-size blocks: predictable callbacks (~64 ms at 16 kHz) instead of PortAudio's variable default
+INPUT_BLOCKSIZE = 1024
+
+def input_latency():
+    """PortAudio input latency from MAILWHISPER_INPUT_LATENCY: 'low', 'high' or seconds (default 'low')."""
+    value = os.getenv("MAILWHISPER_INPUT_LATENCY", "low").strip().lower()
+    if value in ("low", "high"):
+        return value
+    try:
+        return float(value)
+    except ValueError:
+        return "low"
+
 def record_until_enter_mem(samplerate: int = 16000, channels: int = 1) -> np.ndarray:
     """
     Records audio until the user presses Enter.
     """
-    q = queue.Queue()
     stop = threading.Event()
+    # Written only by the audio callback; read after the stream is closed
+    # int16 PCM: half the bytes of float32; transcribe_array converts it once
+    buf = np.empty((_INITIAL_SECONDS * samplerate, channels), dtype=np.int16)
+    pos = 0
+    # Callback status flags, reported after the stream closes (no I/O on the audio thread)
+    flagged, last_status = 0, None
 
     def on_Enter():
         input("") # ENTER terminates
         stop.set()
 
     def audio_cb(indata, frames, time, status):
+        nonlocal buf, pos, flagged, last_status
         if status:
-            print(f"Audio status: {status}", file=sys.stderr)
-        q.put(indata.copy())
+            flagged += 1
+            last_status = status
+        end = pos + frames
+        if end > len(buf):
+            grown = np.empty((max(end, 2 * len(buf)), channels), dtype=np.int16)
+            grown[:pos] = buf[:pos]
+            buf = grown
+        buf[pos:end] = indata
+        pos = end
 
     threading.Thread(target=on_Enter, daemon=True).start()
 
     print("🎙️ Recording… (press ENTER to stop)")
-    chunks = []
-    with sd.InputStream(samplerate=samplerate, channels=channels, callback=audio_cb, dtype='float32'):
-        while not stop.is_set():
-            try:
-                chunks.append(q.get(timeout=0.1))
-            except queue.Empty:
-                pass
-    
-    if not chunks:
+    with sd.InputStream(
+        samplerate=samplerate, channels=channels, callback=audio_cb, dtype='int16',
+        blocksize=INPUT_BLOCKSIZE, latency=input_latency(),
+    ):
+        stop.wait()
+
+    if flagged:
+        print(f"Audio status: {last_status} ({flagged} callback(s) flagged)", file=sys.stderr)
+    if pos == 0:
         raise RuntimeError("No Audiodata recorded.")
-    audio = np.concatenate(chunks, axis=0)
-    return audio
\ No newline at end of file
+    return buf[:pos]
@@ -1,66 +1,265 @@
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, BatchedInferencePipeline
 import os
+import threading
 
 _MODEL: WhisperModel | None = None
+_PIPELINE: BatchedInferencePipeline | None = None
+# The UI warms the model on one thread while a recording may already be transcribed on
+# another; the lock makes the second caller wait for that load instead of starting its own
+_LOAD_LOCK = threading.RLock()  # re-entrant: load_pipeline loads the model under it
+# Bumped by set_whisper_model (which never takes the lock); a load that started under an
+# older generation discards its result instead of publishing the previous model
+_MODEL_GEN = 0
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Int from the environment (at least `minimum`); malformed or missing values fall back to `default`."""
+    try:
+        return max(minimum, int(os.getenv(name, "").strip()))
+    except ValueError:
+        return default
+
+# CTranslate2 defaults to 4 intra-op threads; roughly one per physical core is faster on CPU.
+# Parsed once; 0 (or unset/malformed) means auto
+_CPU_THREADS = _env_int("WHISPER_CPU_THREADS", 0, minimum=0) or max(4, (os.cpu_count() or 8) // 2)
 
 def set_whisper_model(model_name: str):
     """Select a Whisper model name (e.g., 'base', 'small', 'medium').
     Resets the cached model; the next transcribe will load it.
     """
-    global _MODEL
-    os.environ["WHISPER_LOCAL_MODEL"] = (model_name or "medium").strip()
+    global _MODEL, _PIPELINE, _MODEL_GEN
+    name = (model_name or "medium").strip()
+    if name == os.getenv("WHISPER_LOCAL_MODEL", "medium"):
+        return  # unchanged: keep the warm model
+    # No lock: called from the GUI thread, which must not wait for a load in progress.
+    # Order matters: a loader that sees the new generation also sees the new name.
+    os.environ["WHISPER_LOCAL_MODEL"] = name
+    _MODEL_GEN += 1
     _MODEL = None
+    _PIPELINE = None
+
+def _detect_device() -> str:
+    """"cuda" if CTranslate2 sees a CUDA device, else "cpu" (checked once per model load)."""
+    try:
+        import ctranslate2
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except Exception:
+        return "cpu"
 
 def load_model() -> WhisperModel:
     global _MODEL
-    if _MODEL is not None:
-        return _MODEL
+    while True:
+        model = _MODEL
+        if model is not None:
+            return model
+        with _LOAD_LOCK:
+            if _MODEL is not None:
+                return _MODEL
+            gen = _MODEL_GEN
+            model = _create_model()
+            if gen == _MODEL_GEN:
+                _MODEL = model
+                return model
+        # The model was switched during the load: load the new one
 
+def _create_model() -> WhisperModel:
     # Defaults:
     # - CPU:  int8  (fast & ok)
-    # - CUDA: float16 (fast & good)
+    # - CUDA: int8_float16 (int8 weights, fp16 compute: less VRAM, faster than float16)
     model_name   = os.getenv("WHISPER_LOCAL_MODEL", "medium")   # Future: Experiment with "medium" vs "small"
-    device       = os.getenv("WHISPER_DEVICE", "cpu").lower()   # "cpu" or "cuda"
+    device       = os.getenv("WHISPER_DEVICE", "auto").lower()  # "auto", "cpu" or "cuda"
     compute_type = os.getenv("WHISPER_COMPUTE", None)
 
-    if device not in ("cpu", "cuda"):
-        device = "cpu"
+    auto = device not in ("cpu", "cuda")
+    if auto:
+        device = _detect_device()
 
     if compute_type is None:
-        compute_type = "float16" if device == "cuda" else "int8"
+        compute_type = "int8_float16" if device == "cuda" else "int8"
 
-    _MODEL = WhisperModel(
+    try:
+        return _whisper_model(model_name, device, compute_type)
+    except Exception:
+        # "auto" only promises the GPU when it works: a visible device with missing or
+        # mismatched cuDNN/cuBLAS falls back to CPU. An explicit WHISPER_DEVICE=cuda raises.
+        if not (auto and device == "cuda"):
+            raise
+        return _whisper_model(model_name, "cpu", "int8")
+
+def _whisper_model(model_name: str, device: str, compute_type: str) -> WhisperModel:
+    return WhisperModel(
         model_name,
         device=device,
         compute_type=compute_type,
+        cpu_threads=_CPU_THREADS,
+        num_workers=1,  # one transcription at a time
+    )
+
+def load_pipeline() -> BatchedInferencePipeline:
+    """Batched (VAD-chunked) inference wrapper around the cached model."""
+    global _PIPELINE
+    while True:
+        pipeline = _PIPELINE
+        if pipeline is not None:
+            return pipeline
+        with _LOAD_LOCK:
+            if _PIPELINE is not None:
+                return _PIPELINE
+            gen = _MODEL_GEN
+            pipeline = BatchedInferencePipeline(model=load_model())
+            if gen == _MODEL_GEN:
+                _PIPELINE = pipeline
+                return pipeline
+
+# Recordings shorter than this decode greedily (beam 1), longer ones with beam 3
+_GREEDY_MAX_SECONDS = 30.0
+
+def _beam_size(n_samples: int, samplerate: int) -> int:
+    """WHISPER_BEAM if set, else greedy for short dictation and a small beam otherwise."""
+    env = os.getenv("WHISPER_BEAM", "").strip()
+    if env:
+        try:
+            return max(1, int(env))
+        except ValueError:
+            pass
+    return 1 if n_samples < _GREEDY_MAX_SECONDS * samplerate else 3
+
+# Downmix target reused across recordings, grown to the longest one seen. Per thread, so a
+# warmup transcribe can never write into the buffer a real recording is still decoding from
+_SCRATCH = threading.local()
+
+def _mono_scratch(n: int) -> np.ndarray:
+    buf = getattr(_SCRATCH, "mono", None)
+    if buf is None or buf.size < n:
+        buf = _SCRATCH.mono = np.empty(n, dtype=np.float32)
+    return buf[:n]
+
+# Whole recordings below this RMS are treated as silence and never reach Whisper
+_MIN_RMS = 1e-3
+# Edge trim: a 100 ms frame counts as speech when it is above the same floor and clearly
+# (2x RMS, ~6 dB) above the recording's own noise level (its quietest 10% of frames)
+_NOISE_FACTOR = 2.0
+_SILENCE_PAD_FRAMES = 3  # keep 300 ms around the detected speech for soft onsets/endings
+
+def _trim_silence(audio: np.ndarray, samplerate: int) -> np.ndarray:
+    """Slices off silent lead-in/tail (a view); unchanged if nothing is above the threshold."""
+    frame = max(1, samplerate // 10)
+    n = len(audio) // frame
+    if n < 2:
+        return audio
+    frames = audio[: n * frame].reshape(n, frame)
+    # Per-frame mean square in one pass (no squared temporary)
+    energy = np.einsum("ij,ij->i", frames, frames) / frame
+    noise = float(np.percentile(energy, 10))
+    threshold = max(_MIN_RMS * _MIN_RMS, _NOISE_FACTOR * _NOISE_FACTOR * noise)
+    loud = np.flatnonzero(energy > threshold)
+    if loud.size == 0:
+        return audio  # all quiet: leave it to VAD
+    start = max(0, int(loud[0]) - _SILENCE_PAD_FRAMES) * frame
+    last = int(loud[-1]) + _SILENCE_PAD_FRAMES
+    end = len(audio) if last >= n - 1 else (last + 1) * frame
+    return audio[start:end]
+
+def prepare_audio(audio: np.ndarray) -> np.ndarray:
+    """
+    Recorder output (int16 or float, mono or multichannel) -> contiguous mono float32 in [-1, 1].
+    The single normalization path for UI and CLI; transcribe_array applies it itself.
+    Integer and multichannel results live in this thread's scratch buffer (valid until the next call).
+    """
+    audio = np.asarray(audio)
+    is_int = np.issubdtype(audio.dtype, np.integer)
+    if audio.ndim == 2:
+        if audio.shape[1] == 1:
+            audio = audio[:, 0]  # mono capture: a view, no downmix pass
+        else:
+            # Downmix and cast in one pass (float32 accumulator, into the scratch buffer)
+            audio = audio.mean(axis=1, dtype=np.float32, out=_mono_scratch(audio.shape[0]))
+    if is_int:
+        # 16-bit PCM from the recorder: cast and scale to [-1, 1] in one pass. A float32
+        # downmix already sits in the scratch buffer and is scaled in place.
+        out = audio if audio.dtype == np.float32 else _mono_scratch(len(audio))
+        return np.multiply(audio, np.float32(1.0 / 32768.0), out=out)
+    # Float input: cast if needed; a float32 column view is copied to contiguous
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+def _is_silent(audio: np.ndarray) -> bool:
+    if audio.size == 0:
+        return True
+    # dot accumulates the sum of squares in one pass without a squared temporary
+    mean_sq = float(np.dot(audio, audio)) / audio.size
+    return mean_sq < _MIN_RMS * _MIN_RMS
+
+# Parsed once: a malformed value must not break every transcription
+_BATCH_SIZE = _env_int("WHISPER_BATCH_SIZE", 8)
+
+def _run_pipeline(audio: np.ndarray, *, beam_size: int, language: Optional[str]):
+    # VAD cuts the audio into speech chunks that are decoded as one batch
+    return load_pipeline().transcribe(
+        audio,
+        beam_size=beam_size,
+        language=language,         # None = auto
+        batch_size=_BATCH_SIZE,
+        vad_filter=True,
+        without_timestamps=True,
+        # temperature=0.0,         # optional
     )
-    return _MODEL
 
 def transcribe_array(
     audio: np.ndarray,
     *,
     samplerate: int = 16000,
     language: Optional[str] = None,
-    beam_size: int = 5,
+    beam_size: Optional[int] = None,
+    on_segment: Optional[Callable[[str], None]] = None,
 ) -> Tuple[str, Optional[str]]:
     """
     Transcribes a NumPy audio array directly without an extra file.
+    on_segment, if given, receives the transcript so far after each decoded segment.
+    beam_size defaults to WHISPER_BEAM, or greedy for recordings under 30 s (beam 3 above).
     """
-    model = load_model()
+    audio = prepare_audio(audio)
 
-    if audio.ndim == 2:
-        audio = audio.mean(axis=1)
-    if audio.dtype != np.float32:
-        audio = audio.astype(np.float32, copy=False)
+    # Accidental press / nothing said: skip the model (and its load) entirely
+    if _is_silent(audio):
+        return "", None
 
-    segments, info = model.transcribe(
-        audio,
-        beam_size=beam_size,
-        language=language,         # None = auto
-        # vad_filter=True,         # optional
-        # temperature=0.0,         # optional
-    )
-    text = " ".join(seg.text.strip() for seg in segments if seg.text).strip()
-    return text, getattr(info, "language", None)
\ No newline at end of file
+    # Cheap energy trim first, so the VAD/mel front end only scans the spoken part
+    audio = _trim_silence(audio, samplerate)
+    if beam_size is None:
+        beam_size = _beam_size(len(audio), samplerate)
+
+    segments, info = _run_pipeline(audio, beam_size=beam_size, language=language)
+    # segments is lazy; decoding happens while we iterate
+    parts = []
+    so_far = ""
+    for seg in segments:
+        t = (seg.text or "").strip()
+        if not t:
+            continue
+        parts.append(t)
+        if on_segment is not None:
+            # Extend the running text instead of re-joining every part per segment
+            so_far = f"{so_far} {t}" if so_far else t
+            on_segment(so_far)
+    # Parts are stripped and non-empty, so the join needs no outer strip
+    text = " ".join(parts)
+    return text, getattr(info, "language", None)
+
+def warmup_whisper() -> None:
+    """Load the model and decode a short clip so the first real call is warm."""
+    try:
+        load_pipeline()
+        # Plain model call without VAD: through the VAD pipeline the silent clip would be
+        # dropped before the encoder/decoder (and their CTranslate2 kernels) ever ran
+        segments, _ = load_model().transcribe(
+            np.zeros(16000, dtype=np.float32),
+            beam_size=1,
+            language=None,  # auto, like real calls: warms language detection too
+            vad_filter=False,
+            without_timestamps=True,
+        )
+        for _ in segments:
+            pass
+    except Exception:
+        pass  # best effort; the real call will surface errors